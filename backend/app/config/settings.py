@@ -1,91 +1,215 @@
-"""Application configuration using pydantic settings.
+"""Application configuration loaded from environment variables.
 
 Following Google's best practices for config management:
 - Environment-based configuration
 - Type validation
 - Defaults for development
+
+Settings is a plain frozen dataclass read straight from os.environ, so
+importing it does not build a validation schema. Variable names match
+case-insensitively (NEO4J_URI or neo4j_uri), as with pydantic-settings.
+A local .env file is parsed with python-dotenv and merged under the real
+environment (which always wins); it is never written into os.environ.
 """
-from pydantic_settings import BaseSettings
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Mapping, Optional
+import json
+import os
+import sys
+
+from dotenv import dotenv_values
+
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+# Provider/backend selectors compared against literals in the container;
+# interned so those comparisons short-circuit on identity.
+_INTERNED_FIELDS = (
+    "llm_provider",
+    "embedder_provider",
+    "reranker_provider",
+    "chatbot_llm_provider",
+    "vector_db_type",
+    "session_backend",
+    "log_level",
+)
+
+
+def _upper_keys(env: Mapping[str, str]) -> dict[str, str]:
+    """Environment keyed by upper-cased names; an exact upper-case name wins."""
+    upper: dict[str, str] = {}
+    for key, value in env.items():
+        if key.isupper() or key.upper() not in upper:
+            upper[key.upper()] = value
+    return upper
+
+
+def _get_bool(env: Mapping[str, str], key: str, default: bool) -> bool:
+    value = env.get(key)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
 
 
-class Settings(BaseSettings):
+def _get_tuple(env: Mapping[str, str], key: str, default: tuple[str, ...]) -> tuple[str, ...]:
+    value = env.get(key)
+    if value is None:
+        return default
+    value = value.strip()
+    if value.startswith("["):
+        # JSON list, e.g. CORS_ORIGINS=["http://localhost:3000"]
+        return tuple(str(item) for item in json.loads(value))
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class HuggingFaceConfig:
+    """HuggingFace model, endpoint and key settings (HUGGINGFACE_* vars)."""
+
+    api_key: str = ""  # Optional for public models
+    llm_model: str = "Qwen/Qwen2.5-3B-Instruct"
+    llm_endpoint: str = ""  # Custom endpoint URL
+    space_url: str = ""  # Self-hosted Gradio Space
+    embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    embedding_endpoint: str = ""
+    reranker_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    chatbot_model: str = "Qwen/Qwen2.5-3B-Chat"
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> "HuggingFaceConfig":
+        """Build from HUGGINGFACE_<FIELD> environment variables."""
+        defaults = cls()
+        return cls(**{
+            name: env.get(f"HUGGINGFACE_{name.upper()}", getattr(defaults, name))
+            for name in cls.__dataclass_fields__
+        })
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings with environment variable support."""
-    
+
     # App
     app_name: str = "EpiHelix API"
     app_version: str = "0.1.0"
     debug: bool = False
-    
+
     # API
     api_prefix: str = "/api"
-    cors_origins: list[str] = ["*"]
-    
+    cors_origins: tuple[str, ...] = ("*",)
+
     # Neo4j Aura (Knowledge Graph)
     # Get credentials from: https://console.neo4j.io/
-    neo4j_uri: Optional[str] = None  # e.g., "neo4j+s://xxxxx.databases.neo4j.io"
+    # Endpoints and keys are plain strings; "" means not configured.
+    neo4j_uri: str = ""  # e.g., "neo4j+s://xxxxx.databases.neo4j.io"
     neo4j_user: str = "neo4j"
-    neo4j_password: Optional[str] = None
+    neo4j_password: str = ""
     neo4j_database: str = "neo4j"
-    
+    neo4j_pool_size: int = 100  # Max connections in the driver pool
+    neo4j_acquisition_timeout: float = 60.0  # Seconds to wait for a pooled connection
+    neo4j_query_timeout: float = 30.0  # Seconds before a query is abandoned
+
     # Vector DB (for semantic search)
     # Neo4j 5+ has native vector support - no separate vector DB needed
     vector_db_type: str = "neo4j"  # "neo4j" or "mock"
-    
+
     # ===== Kaggle AI Services (Unified GPU Endpoint) =====
     # REQUIRED: Get this URL from Kaggle notebook output after running ngrok
     # Example: https://1234-56-789-012-34.ngrok-free.app
-    kaggle_ai_endpoint: Optional[str] = None
-    
+    kaggle_ai_endpoint: str = ""
+
     # ===== LLM Configuration (Self-Hosted) =====
     llm_provider: str = "kaggle"  # "huggingface", "huggingface_space", "kaggle", "mock"
-    
-    # HuggingFace Settings
-    huggingface_api_key: Optional[str] = None  # Optional for public models
-    huggingface_llm_model: str = "Qwen/Qwen2.5-3B-Instruct"
-    huggingface_llm_endpoint: Optional[str] = None  # Custom endpoint URL
-    
-    # HuggingFace Space Settings (for self-hosted Gradio apps)
-    huggingface_space_url: Optional[str] = None
-    
+
+    # HuggingFace Settings (models, endpoints, key)
+    huggingface: HuggingFaceConfig = HuggingFaceConfig()
+
     # LLM Generation Parameters
     llm_temperature: float = 0.7
     llm_max_tokens: int = 512
-    
+
     # ===== Embedder Configuration (Self-Hosted) =====
     embedder_provider: str = "kaggle"  # "huggingface", "kaggle", "mock"
-    
+
     # Embedding Model Settings
-    huggingface_embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
-    huggingface_embedding_endpoint: Optional[str] = None
     embedding_dimension: int = 384  # Must match model dimension
-    
+
     # ===== Reranker Configuration =====
     reranker_provider: str = "kaggle"  # "huggingface", "kaggle", "mock"
-    huggingface_reranker_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
-    
+
     # ===== Chatbot Configuration (LangChain) =====
     chatbot_llm_provider: str = "groq"  # "huggingface", "kaggle", "groq", "mock"
-    huggingface_chatbot_model: str = "Qwen/Qwen2.5-3B-Chat"
     chatbot_temperature: float = 0.7
     chatbot_max_tokens: int = 512
     session_backend: str = "memory"  # "memory", "redis"
-    
+
     # ===== Groq Configuration =====
-    groq_api_key: Optional[str] = None
+    groq_api_key: str = ""
     groq_model: str = "llama-3.3-70b-versatile"
-    
+
     # External data sources (optional - for future ETL)
     wikidata_endpoint: str = "https://query.wikidata.org/sparql"
-    
+
     # Logging
     log_level: str = "INFO"
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+
+    def __post_init__(self) -> None:
+        for name in _INTERNED_FIELDS:
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "Settings":
+        """Build settings from environment variables (field names, any case)."""
+        env = _upper_keys(os.environ if env is None else env)
+        defaults = cls()
+        return cls(
+            app_name=env.get("APP_NAME", defaults.app_name),
+            app_version=env.get("APP_VERSION", defaults.app_version),
+            debug=_get_bool(env, "DEBUG", defaults.debug),
+            api_prefix=env.get("API_PREFIX", defaults.api_prefix),
+            cors_origins=_get_tuple(env, "CORS_ORIGINS", defaults.cors_origins),
+            neo4j_uri=env.get("NEO4J_URI", defaults.neo4j_uri),
+            neo4j_user=env.get("NEO4J_USER", defaults.neo4j_user),
+            neo4j_password=env.get("NEO4J_PASSWORD", defaults.neo4j_password),
+            neo4j_database=env.get("NEO4J_DATABASE", defaults.neo4j_database),
+            neo4j_pool_size=int(env.get("NEO4J_POOL_SIZE", defaults.neo4j_pool_size)),
+            neo4j_acquisition_timeout=float(
+                env.get("NEO4J_ACQUISITION_TIMEOUT", defaults.neo4j_acquisition_timeout)
+            ),
+            neo4j_query_timeout=float(
+                env.get("NEO4J_QUERY_TIMEOUT", defaults.neo4j_query_timeout)
+            ),
+            vector_db_type=env.get("VECTOR_DB_TYPE", defaults.vector_db_type),
+            kaggle_ai_endpoint=env.get("KAGGLE_AI_ENDPOINT", defaults.kaggle_ai_endpoint),
+            llm_provider=env.get("LLM_PROVIDER", defaults.llm_provider),
+            huggingface=HuggingFaceConfig.from_env(env),
+            llm_temperature=float(env.get("LLM_TEMPERATURE", defaults.llm_temperature)),
+            llm_max_tokens=int(env.get("LLM_MAX_TOKENS", defaults.llm_max_tokens)),
+            embedder_provider=env.get("EMBEDDER_PROVIDER", defaults.embedder_provider),
+            embedding_dimension=int(env.get("EMBEDDING_DIMENSION", defaults.embedding_dimension)),
+            reranker_provider=env.get("RERANKER_PROVIDER", defaults.reranker_provider),
+            chatbot_llm_provider=env.get("CHATBOT_LLM_PROVIDER", defaults.chatbot_llm_provider),
+            chatbot_temperature=float(env.get("CHATBOT_TEMPERATURE", defaults.chatbot_temperature)),
+            chatbot_max_tokens=int(env.get("CHATBOT_MAX_TOKENS", defaults.chatbot_max_tokens)),
+            session_backend=env.get("SESSION_BACKEND", defaults.session_backend),
+            groq_api_key=env.get("GROQ_API_KEY", defaults.groq_api_key),
+            groq_model=env.get("GROQ_MODEL", defaults.groq_model),
+            wikidata_endpoint=env.get("WIKIDATA_ENDPOINT", defaults.wikidata_endpoint),
+            log_level=env.get("LOG_LEVEL", defaults.log_level).upper(),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance.
+
+    The environment and .env file are read once; later calls (including
+    re-imports in tests and workers) return the cached instance.
+    """
+    env_file = {k: v for k, v in dotenv_values(".env").items() if v is not None}
+    return Settings.from_env({**_upper_keys(env_file), **_upper_keys(os.environ)})
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,74 @@
+"""In-process caching helpers.
+
+Intended for use from the event loop: operations never await, so no lock
+is needed to keep them consistent.
+"""
+from collections import OrderedDict
+from typing import Any, Hashable
+import time
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """LRU cache whose entries also expire after `ttl` seconds.
+
+    Example:
+        cache = TTLCache(maxsize=512, ttl=60.0)
+        hit = cache.get(key)
+        if hit is None:
+            hit = await compute()
+            cache.set(key, hit)
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or `default` if missing or expired."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        """Size and hit/miss counters, for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
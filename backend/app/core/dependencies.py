@@ -10,62 +10,234 @@ New architecture (Retriever pattern):
 - Utils: Pure utilities (embedder, reranker, llm)
 - Services: Business logic only (summary_service)
 """
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Annotated, Any, Callable, Optional, TYPE_CHECKING
+import asyncio
 import logging
 
-from ..config.settings import settings
-from ..db.kg_client import (
-    KnowledgeGraphClient,
-    Neo4jClient
-)
-from ..repositories.entity_repository import (
-    EntityRepository,
-    Neo4jEntityRepository
-)
-from ..retrievers import (
-    BaseRetriever,
-    KeywordRetriever,
-    SemanticRetriever,
-    HybridRetriever
-)
-from ..utils import (
-    BaseEmbedder,
-    KaggleEmbedder,
-    BaseReranker,
-    KaggleReranker,
-    BaseLLM,
-    KaggleLLM,
-    GroqLLM
-)
-from ..services.entity_service import EntityService
-from ..services.summary_service import SummaryService
-from ..services.query_service import QueryService
-from ..services.chatbot_service import ChatbotService
+from fastapi import Depends
+
+from ..config.settings import get_settings
 
+# Provider, retriever and service modules pull in httpx, groq and numpy.
+# They are imported inside the _create_* factories so that only the
+# configured providers are loaded at startup.
+if TYPE_CHECKING:
+    import httpx
+    from ..config.settings import Settings
+    from ..db.kg_client import KnowledgeGraphClient
+    from ..repositories.entity_repository import EntityRepository
+    from ..retrievers import BaseRetriever
+    from ..utils import BaseEmbedder, BaseReranker, BaseLLM, GroqLLM
+    from ..services.entity_service import EntityService
+    from ..services.summary_service import SummaryService
+    from ..services.query_service import QueryService
+    from ..services.chatbot_service import ChatbotService
+
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
+# Utility factories. Settings is frozen and hashable, so each factory is
+# memoized on its inputs: re-running init_resources() (e.g. per test) reuses
+# the same clients instead of opening new connection pools. The caches are
+# cleared in shutdown_resources(), after the clients are closed.
+
+@lru_cache(maxsize=1)
+def _create_kaggle_http(settings: "Settings") -> Optional["httpx.AsyncClient"]:
+    """Create the HTTP client shared by the Kaggle utilities."""
+    if not settings.kaggle_ai_endpoint:
+        return None
+
+    import httpx
+
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=16)
+    )
+
+
+def _make_kaggle_llm(
+    settings: "Settings",
+    http: Optional["httpx.AsyncClient"]
+) -> Optional["BaseLLM"]:
+    """Create Kaggle LLM utility."""
+    if not settings.kaggle_ai_endpoint:
+        logger.info("⚠️ Kaggle LLM not configured")
+        return None
+
+    from ..utils.llm import KaggleLLM
+
+    logger.info("✅ Using Kaggle LLM: %s", settings.kaggle_ai_endpoint)
+    return KaggleLLM(
+        endpoint_url=settings.kaggle_ai_endpoint,
+        timeout=60,
+        client=http
+    )
+
+
+def _make_groq_llm(
+    settings: "Settings",
+    http: Optional["httpx.AsyncClient"]
+) -> Optional["GroqLLM"]:
+    """Create Groq LLM for chatbot."""
+    if not settings.groq_api_key:
+        return None
+
+    from ..utils.llm_groq import GroqLLM
+
+    logger.info("✅ Using Groq LLM: %s", settings.groq_model)
+    return GroqLLM(
+        api_key=settings.groq_api_key,
+        model=settings.groq_model,
+        temperature=settings.chatbot_temperature,
+        max_tokens=settings.chatbot_max_tokens
+    )
+
+
+def _make_kaggle_embedder(
+    settings: "Settings",
+    http: Optional["httpx.AsyncClient"]
+) -> "BaseEmbedder":
+    """Create Kaggle embedder utility."""
+    if not settings.kaggle_ai_endpoint:
+        raise ValueError("Kaggle AI endpoint required! Set KAGGLE_AI_ENDPOINT in .env")
+
+    from ..utils.embedder import KaggleEmbedder
+
+    logger.info("Using Kaggle Embedder: %s", settings.kaggle_ai_endpoint)
+    return KaggleEmbedder(
+        endpoint_url=settings.kaggle_ai_endpoint,
+        dimension=settings.embedding_dimension,
+        timeout=30,
+        client=http
+    )
+
+
+def _make_kaggle_reranker(
+    settings: "Settings",
+    http: Optional["httpx.AsyncClient"]
+) -> "BaseReranker":
+    """Create Kaggle reranker utility."""
+    if not settings.kaggle_ai_endpoint:
+        raise ValueError("Kaggle AI endpoint required! Set KAGGLE_AI_ENDPOINT in .env")
+
+    from ..utils.reranker import KaggleReranker
+
+    logger.info("Using Kaggle Reranker: %s", settings.kaggle_ai_endpoint)
+    return KaggleReranker(
+        endpoint_url=settings.kaggle_ai_endpoint,
+        timeout=30,
+        client=http
+    )
+
+
+# Provider registries: settings.<x>_provider -> factory(settings, http).
+# Register new providers here; the container never branches on names.
+# Kaggle is the only embedder/reranker backend, so it is also the fallback
+# for those (matching the previous behaviour of ignoring the setting).
+UtilityFactory = Callable[["Settings", Optional["httpx.AsyncClient"]], Any]
+
+LLM_FACTORIES: dict[str, UtilityFactory] = {"kaggle": _make_kaggle_llm}
+CHATBOT_LLM_FACTORIES: dict[str, UtilityFactory] = {"groq": _make_groq_llm}
+EMBEDDER_FACTORIES: dict[str, UtilityFactory] = {"kaggle": _make_kaggle_embedder}
+RERANKER_FACTORIES: dict[str, UtilityFactory] = {"kaggle": _make_kaggle_reranker}
+
+
+def _no_provider(settings: "Settings", http: Optional["httpx.AsyncClient"]) -> None:
+    return None
+
+
+@lru_cache(maxsize=1)
+def _create_llm(
+    settings: "Settings",
+    http: Optional["httpx.AsyncClient"]
+) -> Optional["BaseLLM"]:
+    """Create the LLM utility for the configured provider, if any."""
+    factory = LLM_FACTORIES.get(settings.llm_provider, _no_provider)
+    return factory(settings, http)
+
+
+@lru_cache(maxsize=1)
+def _create_groq_llm(settings: "Settings") -> Optional["GroqLLM"]:
+    """Create the chatbot LLM for the configured provider, if any."""
+    factory = CHATBOT_LLM_FACTORIES.get(settings.chatbot_llm_provider, _no_provider)
+    llm = factory(settings, None)
+    if llm is None:
+        logger.warning("⚠️ Groq LLM not configured (set GROQ_API_KEY and CHATBOT_LLM_PROVIDER=groq)")
+    return llm
+
+
+@lru_cache(maxsize=1)
+def _create_embedder(
+    settings: "Settings",
+    http: Optional["httpx.AsyncClient"]
+) -> "BaseEmbedder":
+    """Create the embedder utility for the configured provider."""
+    factory = EMBEDDER_FACTORIES.get(settings.embedder_provider, _make_kaggle_embedder)
+    return factory(settings, http)
+
+
+@lru_cache(maxsize=1)
+def _create_reranker(
+    settings: "Settings",
+    http: Optional["httpx.AsyncClient"]
+) -> "BaseReranker":
+    """Create the reranker utility for the configured provider."""
+    factory = RERANKER_FACTORIES.get(settings.reranker_provider, _make_kaggle_reranker)
+    return factory(settings, http)
+
+
+_FACTORY_CACHES = (
+    _create_kaggle_http,
+    _create_llm,
+    _create_groq_llm,
+    _create_embedder,
+    _create_reranker
+)
+
+
 class Container:
     """Dependency injection container."""
     
+    # Primitives live in slots; __dict__ is kept for the cached_property
+    # services below, which store their value in the instance dict.
+    __slots__ = (
+        "_kg_client",
+        "_entity_repo",
+        "_kaggle_http",
+        "_embedder",
+        "_reranker",
+        "_llm",
+        "_groq_llm",
+        "_retriever",
+        "__dict__"
+    )
+    
+    _SERVICE_PROPERTIES = (
+        "entity_service",
+        "summary_service",
+        "query_service",
+        "chatbot_service"
+    )
+    
     def __init__(self):
-        self._kg_client: Optional[KnowledgeGraphClient] = None
-        self._entity_repo: Optional[EntityRepository] = None
+        self._kg_client: Optional["KnowledgeGraphClient"] = None
+        self._entity_repo: Optional["EntityRepository"] = None
         
         # Utilities (direct use, no wrappers)
-        self._embedder: Optional[BaseEmbedder] = None
-        self._reranker: Optional[BaseReranker] = None
-        self._llm: Optional[BaseLLM] = None
-        self._groq_llm: Optional[GroqLLM] = None
+        self._kaggle_http: Optional["httpx.AsyncClient"] = None
+        self._embedder: Optional["BaseEmbedder"] = None
+        self._reranker: Optional["BaseReranker"] = None
+        self._llm: Optional["BaseLLM"] = None
+        self._groq_llm: Optional["GroqLLM"] = None
         
         # Retriever (search strategy)
-        self._retriever: Optional[BaseRetriever] = None
+        self._retriever: Optional["BaseRetriever"] = None
         
-        # Services (business logic only)
-        self._entity_service: Optional[EntityService] = None
-        self._summary_service: Optional[SummaryService] = None
-        self._query_service: Optional[QueryService] = None
-        self._chatbot_service: Optional[ChatbotService] = None
+        # Services (business logic only) are cached properties built on
+        # first access from the primitives above; see entity_service etc.
     
     async def init_resources(self):
         """Initialize all resources (call on startup)."""
@@ -76,18 +248,30 @@ class Container:
         await kg_client.connect()
         self._kg_client = kg_client
         
-        # Ensure required indexes exist
-        await kg_client.ensure_indexes()
-        
         # Initialize repositories
-        self._entity_repo = self._create_entity_repository(kg_client)
+        # (each KG client builds its matching repository, so no type dispatch)
+        self._entity_repo = kg_client.create_entity_repository()
+        
+        # Initialize utilities (direct use, no wrappers); the Kaggle
+        # utilities share one HTTP/2 connection pool to the same endpoint
+        self._kaggle_http = _create_kaggle_http(settings)
+        self._llm = _create_llm(settings, self._kaggle_http)
+        self._embedder = _create_embedder(settings, self._kaggle_http)
+        self._reranker = _create_reranker(settings, self._kaggle_http)
         
-        # Initialize utilities (direct use, no wrappers)
-        self._llm = self._create_llm()
-        self._embedder = self._create_embedder()
-        self._reranker = self._create_reranker()
+        # Ensure required indexes exist and warm the AI endpoints
+        # concurrently (independent network round-trips)
+        await asyncio.gather(
+            kg_client.ensure_indexes(),
+            *(
+                utility.warmup()
+                for utility in (self._llm, self._embedder, self._reranker)
+                if utility
+            )
+        )
         
         # Initialize retriever (search strategy)
+        from ..retrievers import HybridRetriever
         self._retriever = HybridRetriever(
             entity_repository=self._entity_repo,
             embedder=self._embedder,
@@ -97,25 +281,12 @@ class Container:
         )
 
         # Initialize Groq LLM (shared for chatbot and summary)
-        self._groq_llm = self._create_groq_llm()
-
-        # Initialize business services (business logic only)
-        self._entity_service = EntityService(self._entity_repo)
-        self._summary_service = SummaryService(
-            entity_repository=self._entity_repo,
-            groq_llm=self._groq_llm
-        )
-        self._query_service = QueryService(entity_repo=self._entity_repo)
-
-        # Initialize chatbot service
-        if self._groq_llm:
-            self._chatbot_service = ChatbotService(
-                retriever=self._retriever,
-                llm=self._groq_llm,
-                max_context_entities=5
-            )
-        else:
-            logger.warning("ChatbotService not initialized (Groq LLM not configured)")
+        self._groq_llm = _create_groq_llm(settings)
+        if not self._groq_llm:
+            logger.warning("ChatbotService not available (Groq LLM not configured)")
+        
+        # Drop wrappers memoized against a previous initialization
+        self.clear_dependency_cache()
         
         logger.info("Resources initialized successfully")
     
@@ -130,182 +301,202 @@ class Container:
             await self._reranker.close()
         if self._llm:
             await self._llm.close()
+        if self._kaggle_http:
+            await self._kaggle_http.aclose()
         if self._kg_client:
             await self._kg_client.disconnect()
         
+        # Drop cached services and (now closed) utilities so a later
+        # init_resources() rebuilds them
+        for name in self._SERVICE_PROPERTIES:
+            self.__dict__.pop(name, None)
+        for factory in _FACTORY_CACHES:
+            factory.cache_clear()
+        self.clear_dependency_cache()
+        
         logger.info("Resources shut down")
     
-    async def _create_kg_client(self) -> KnowledgeGraphClient:
+    async def _create_kg_client(self) -> "KnowledgeGraphClient":
         """Create Neo4j client for Neo4j Aura."""
         if not settings.neo4j_uri or not settings.neo4j_password:
             raise ValueError(
                 "Neo4j configuration required! Set NEO4J_URI and NEO4J_PASSWORD in .env file"
             )
         
-        logger.info(f"Connecting to Neo4j at: {settings.neo4j_uri}")
+        from ..db.kg_client import Neo4jClient
+
+        logger.info("Connecting to Neo4j at: %s", settings.neo4j_uri)
         return Neo4jClient(
             uri=settings.neo4j_uri,
             user=settings.neo4j_user,
             password=settings.neo4j_password,
-            database=settings.neo4j_database
+            database=settings.neo4j_database,
+            pool_size=settings.neo4j_pool_size,
+            acquisition_timeout=settings.neo4j_acquisition_timeout,
+            query_timeout=settings.neo4j_query_timeout
         )
     
-    def _create_entity_repository(self, client: KnowledgeGraphClient) -> EntityRepository:
-        """Create entity repository for Neo4j."""
-        logger.info("Initializing Neo4j entity repository")
-        return Neo4jEntityRepository(client)
-    
-    def _create_llm(self) -> Optional[BaseLLM]:
-        """Create Kaggle LLM utility."""
-        if settings.llm_provider == "kaggle" and settings.kaggle_ai_endpoint:
-            logger.info(f"✅ Using Kaggle LLM: {settings.kaggle_ai_endpoint}")
-            
-            return KaggleLLM(
-                endpoint_url=settings.kaggle_ai_endpoint,
-                timeout=60
-            )
-        else:
-            logger.info("⚠️ Kaggle LLM not configured")
-            return None
-        
-    def _create_groq_llm(self) -> Optional[GroqLLM]:
-        """Create Groq LLM for chatbot."""
-        if settings.chatbot_llm_provider == "groq" and settings.groq_api_key:
-            logger.info(f"✅ Using Groq LLM: {settings.groq_model}")
-            return GroqLLM(
-                api_key=settings.groq_api_key,
-                model=settings.groq_model,
-                temperature=settings.chatbot_temperature,
-                max_tokens=settings.chatbot_max_tokens
-            )
-        else:
-            logger.warning("⚠️ Groq LLM not configured (set GROQ_API_KEY and CHATBOT_LLM_PROVIDER=groq)")
-            return None
-    
-    def _create_embedder(self) -> BaseEmbedder:
-        """Create Kaggle embedder utility."""
-        if settings.kaggle_ai_endpoint:
-            logger.info(f"Using Kaggle Embedder: {settings.kaggle_ai_endpoint}")
-            return KaggleEmbedder(
-                endpoint_url=settings.kaggle_ai_endpoint,
-                dimension=settings.embedding_dimension,
-                timeout=30
-            )
-        else:
-            raise ValueError("Kaggle AI endpoint required! Set KAGGLE_AI_ENDPOINT in .env")
-    
-    def _create_reranker(self) -> BaseReranker:
-        """Create Kaggle reranker utility."""
-        if settings.kaggle_ai_endpoint:
-            logger.info(f"Using Kaggle Reranker: {settings.kaggle_ai_endpoint}")
-            return KaggleReranker(
-                endpoint_url=settings.kaggle_ai_endpoint,
-                timeout=30
-            )
-        else:
-            raise ValueError("Kaggle AI endpoint required! Set KAGGLE_AI_ENDPOINT in .env")
-    
     # Getters for dependency injection
     
-    def get_kg_client(self) -> KnowledgeGraphClient:
+    @staticmethod
+    def clear_dependency_cache() -> None:
+        """Forget the objects memoized by the FastAPI dependency wrappers."""
+        for wrapper in _DEPENDENCY_WRAPPERS:
+            wrapper.cache_clear()
+    
+    def get_kg_client(self) -> "KnowledgeGraphClient":
         """Get KG client instance."""
         if not self._kg_client:
             raise RuntimeError("KG client not initialized")
         return self._kg_client
     
-    def get_entity_repository(self) -> EntityRepository:
+    def get_entity_repository(self) -> "EntityRepository":
         """Get entity repository instance."""
         if not self._entity_repo:
             raise RuntimeError("Entity repository not initialized")
         return self._entity_repo
     
-    def get_embedder(self) -> BaseEmbedder:
+    def get_embedder(self) -> "BaseEmbedder":
         """Get embedder utility instance."""
         if not self._embedder:
             raise RuntimeError("Embedder not initialized")
         return self._embedder
     
-    def get_reranker(self) -> BaseReranker:
+    def get_reranker(self) -> "BaseReranker":
         """Get reranker utility instance."""
         if not self._reranker:
             raise RuntimeError("Reranker not initialized")
         return self._reranker
     
-    def get_retriever(self) -> BaseRetriever:
+    def get_retriever(self) -> "BaseRetriever":
         """Get retriever instance (HybridRetriever)."""
         if not self._retriever:
             raise RuntimeError("Retriever not initialized")
         return self._retriever
     
-    def get_entity_service(self) -> EntityService:
-        """Get entity service instance."""
-        if not self._entity_service:
-            raise RuntimeError("Entity service not initialized")
-        return self._entity_service
+    # Services (built once on first access, then a plain attribute read)
     
-    def get_summary_service(self) -> SummaryService:
-        """Get summary service instance."""
-        if not self._summary_service:
-            raise RuntimeError("Summary service not initialized")
-        return self._summary_service
+    @cached_property
+    def entity_service(self) -> "EntityService":
+        """Entity service instance."""
+        from ..services.entity_service import EntityService
+        return EntityService(self.get_entity_repository())
     
-    def get_query_service(self) -> QueryService:
-        """Get query service instance."""
-        if not self._query_service:
-            raise RuntimeError("Query service not initialized")
-        return self._query_service
+    @cached_property
+    def summary_service(self) -> "SummaryService":
+        """Summary service instance."""
+        from ..services.summary_service import SummaryService
+        return SummaryService(
+            entity_repository=self.get_entity_repository(),
+            groq_llm=self._groq_llm
+        )
     
-    def get_chatbot_service(self) -> ChatbotService:
-        """Get chatbot service instance."""
-        if not self._chatbot_service:
+    @cached_property
+    def query_service(self) -> "QueryService":
+        """Query service instance."""
+        from ..services.query_service import QueryService
+        return QueryService(entity_repo=self.get_entity_repository())
+    
+    @cached_property
+    def chatbot_service(self) -> "ChatbotService":
+        """Chatbot service instance."""
+        if not self._groq_llm:
             raise RuntimeError("Chatbot service not initialized. Check GROQ_API_KEY in .env")
-        return self._chatbot_service
+        from ..services.chatbot_service import ChatbotService
+        return ChatbotService(
+            retriever=self.get_retriever(),
+            llm=self._groq_llm,
+            max_context_entities=5
+        )
 
 
 # Global container instance
 container = Container()
 
 
-# FastAPI dependency injection wrappers
-def get_kg_client() -> KnowledgeGraphClient:
+# FastAPI dependency injection wrappers. The container hands out the same
+# objects for the lifetime of the app, so each wrapper is memoized; getters
+# that raise (not initialized yet) are not cached. Cleared on shutdown via
+# Container.clear_dependency_cache().
+
+@lru_cache(maxsize=1)
+def get_kg_client() -> "KnowledgeGraphClient":
     """FastAPI dependency: Get KG client."""
     return container.get_kg_client()
 
 
-def get_entity_repository() -> EntityRepository:
+@lru_cache(maxsize=1)
+def get_entity_repository() -> "EntityRepository":
     """FastAPI dependency: Get entity repository."""
     return container.get_entity_repository()
 
 
-def get_embedder() -> BaseEmbedder:
+@lru_cache(maxsize=1)
+def get_embedder() -> "BaseEmbedder":
     """FastAPI dependency: Get embedder utility."""
     return container.get_embedder()
 
 
-def get_reranker() -> BaseReranker:
+@lru_cache(maxsize=1)
+def get_reranker() -> "BaseReranker":
     """FastAPI dependency: Get reranker utility."""
     return container.get_reranker()
 
 
-def get_retriever() -> BaseRetriever:
+@lru_cache(maxsize=1)
+def get_retriever() -> "BaseRetriever":
     """FastAPI dependency: Get retriever (HybridRetriever)."""
     return container.get_retriever()
 
 
-def get_entity_service() -> EntityService:
+@lru_cache(maxsize=1)
+def get_entity_service() -> "EntityService":
     """FastAPI dependency: Get entity service."""
-    return container.get_entity_service()
+    return container.entity_service
 
 
-def get_summary_service() -> SummaryService:
+@lru_cache(maxsize=1)
+def get_summary_service() -> "SummaryService":
     """FastAPI dependency: Get summary service."""
-    return container.get_summary_service()
+    return container.summary_service
 
 
-def get_query_service() -> QueryService:
+@lru_cache(maxsize=1)
+def get_query_service() -> "QueryService":
     """FastAPI dependency: Get query service."""
-    return container.get_query_service()
+    return container.query_service
 
-def get_chatbot_service() -> ChatbotService:
+
+@lru_cache(maxsize=1)
+def get_chatbot_service() -> "ChatbotService":
     """FastAPI dependency: Get chatbot service."""
-    return container.get_chatbot_service()
\ No newline at end of file
+    return container.chatbot_service
+
+
+_DEPENDENCY_WRAPPERS = (
+    get_kg_client,
+    get_entity_repository,
+    get_embedder,
+    get_reranker,
+    get_retriever,
+    get_entity_service,
+    get_summary_service,
+    get_query_service,
+    get_chatbot_service
+)
+
+
+# Annotated dependency aliases for route signatures, e.g.
+#     async def handler(service: EntityServiceDep): ...
+# The types are forward references so that importing this module does not
+# load the provider and service modules (FastAPI does not need the type of
+# a Depends() parameter).
+KGClientDep = Annotated["KnowledgeGraphClient", Depends(get_kg_client)]
+EntityRepositoryDep = Annotated["EntityRepository", Depends(get_entity_repository)]
+EmbedderDep = Annotated["BaseEmbedder", Depends(get_embedder)]
+RerankerDep = Annotated["BaseReranker", Depends(get_reranker)]
+RetrieverDep = Annotated["BaseRetriever", Depends(get_retriever)]
+EntityServiceDep = Annotated["EntityService", Depends(get_entity_service)]
+SummaryServiceDep = Annotated["SummaryService", Depends(get_summary_service)]
+QueryServiceDep = Annotated["QueryService", Depends(get_query_service)]
+ChatbotServiceDep = Annotated["ChatbotService", Depends(get_chatbot_service)]
@@ -1,14 +1,34 @@
-"""Database clients module."""
-from .kg_client import (
-    KnowledgeGraphClient,
-    Neo4jClient,
-    get_kg_client,
-    kg_client
-)
-
-__all__ = [
-    "KnowledgeGraphClient",
-    "Neo4jClient",
-    "get_kg_client",
-    "kg_client"
-]
+"""Database clients module.
+
+Names are resolved on first access (PEP 562) so that ``import app.db``
+does not load the client module until a client is actually used.
+"""
+import importlib
+
+_EXPORTS = {
+    "KnowledgeGraphClient": "kg_client",
+    "Neo4jClient": "kg_client",
+    "get_kg_client": "kg_client",
+    "kg_client": "kg_client"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    # Bind every export of the module at once: importing a submodule sets
+    # it as a package attribute, which would shadow a same-named export
+    # (kg_client) on later lookups.
+    for export, source in _EXPORTS.items():
+        if source == module_name:
+            globals()[export] = getattr(module, export)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,76 @@
+"""Minimal in-process circuit breaker for database calls.
+
+After `failure_threshold` consecutive failures the circuit opens and calls
+fail immediately with CircuitOpenError (without touching the connection
+pool) until `recovery_timeout` seconds have passed. The next call is then
+let through as a single probe (concurrent calls keep failing fast while it
+runs): success closes the circuit, failure re-opens it.
+"""
+from typing import Optional
+import asyncio
+import time
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the backend while the circuit is open."""
+
+
+class CircuitBreaker:
+    """Async context manager guarding calls to an unreliable backend.
+
+    Example:
+        async with breaker:
+            await client.run(...)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 10.0,
+        failure_types: tuple[type[BaseException], ...] = (Exception,)
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            recovery_timeout: Seconds to stay open before a probe call
+            failure_types: Exceptions that count as backend failures
+                (others, e.g. query syntax errors, pass through uncounted)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failure_types = failure_types
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        # Task running the half-open probe call, if any
+        self._probe: Optional[asyncio.Task] = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being rejected."""
+        if self._opened_at is None:
+            return False
+        return (
+            time.monotonic() - self._opened_at < self.recovery_timeout
+            or self._probe is not None
+        )
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        if self.is_open:
+            raise CircuitOpenError("Circuit open: backend recently failing, try again later")
+        if self._opened_at is not None:
+            # Half-open: this call is the probe
+            self._probe = asyncio.current_task()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self._probe is not None and self._probe is asyncio.current_task():
+            self._probe = None
+        if exc_type is None:
+            self._failures = 0
+            self._opened_at = None
+        elif issubclass(exc_type, self.failure_types):
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+        return False
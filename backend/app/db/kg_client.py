@@ -6,12 +6,77 @@ Following Google's best practices:
 - Health checks
 - Graceful error handling
 """
-from typing import Optional, Any
+from typing import Optional, Any, TYPE_CHECKING
 from abc import ABC, abstractmethod
+import asyncio
 import logging
+import re
+
+from .circuit_breaker import CircuitBreaker
+
+if TYPE_CHECKING:
+    from ..repositories.entity_repository import EntityRepository
 
 logger = logging.getLogger(__name__)
 
+# Fulltext index 'entitySearch': all searchable text properties of the
+# entity labels, for comprehensive keyword search
+FULLTEXT_LABELS = (
+    "Country", "Disease", "Outbreak", "VaccinationRecord", "Organization", "Vaccine"
+)
+FULLTEXT_PROPS = (
+    "name", "fullName", "label", "description", "summary", "title",
+    "code", "iso_code", "icd10", "mesh", "category", "pathogen",
+    "causativeAgent", "medicalSpecialty", "prevention",
+    "acronym", "role", "vaccineName", "manufacturer",
+    "capital", "continent", "wikipediaAbstract"
+)
+# Use CREATE FULLTEXT INDEX syntax (compatible with Neo4j Aura)
+ENTITY_SEARCH_DDL = (
+    "CREATE FULLTEXT INDEX entitySearch IF NOT EXISTS "
+    f"FOR (n:{'|'.join(FULLTEXT_LABELS)}) "
+    f"ON EACH [{', '.join('n.' + p for p in FULLTEXT_PROPS)}]"
+)
+
+# Fulltext index 'entityKeywordSearch': exactly the text properties that
+# Neo4jEntityRepository.search scores (including the string-list
+# properties), so it can fetch candidates from the index instead of
+# scanning every entity node
+KEYWORD_SEARCH_INDEX = "entityKeywordSearch"
+KEYWORD_SEARCH_PROPS = (
+    "name", "fullName", "id", "label", "code", "description",
+    "wikipediaAbstract", "category", "icd10", "mesh", "continent",
+    "capital", "acronym", "vaccineName", "manufacturer", "role",
+    "symptoms", "drugs", "treatments", "possibleTreatments",
+    "transmissionMethods", "riskFactors"
+)
+KEYWORD_SEARCH_DDL = (
+    f"CREATE FULLTEXT INDEX {KEYWORD_SEARCH_INDEX} IF NOT EXISTS "
+    f"FOR (n:{'|'.join(FULLTEXT_LABELS)}) "
+    f"ON EACH [{', '.join('n.' + p for p in KEYWORD_SEARCH_PROPS)}]"
+)
+# Range indexes for the property lookups and filters the repository runs
+# (disease/country keys, year filters of the chart and heatmap queries).
+# The year indexes share the ETL's names (kg-construction create_indexes),
+# so on a database it loaded those are no-ops.
+PROPERTY_INDEX_DDL = (
+    "CREATE INDEX disease_id_index IF NOT EXISTS FOR (n:Disease) ON (n.id)",
+    "CREATE INDEX country_code_index IF NOT EXISTS FOR (n:Country) ON (n.code)",
+    "CREATE INDEX outbreak_year IF NOT EXISTS FOR (n:Outbreak) ON (n.year)",
+    "CREATE INDEX vaccination_year IF NOT EXISTS FOR (n:VaccinationRecord) ON (n.year)",
+)
+# Characters with meaning in Lucene query syntax (&& and || are covered
+# by escaping each & and |)
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+
+
+def escape_fulltext_query(text: str) -> str:
+    """Escape user text for db.index.fulltext.queryNodes.
+    
+    Without this, input like "covid-19 (usa" is a Lucene parse error.
+    """
+    return _LUCENE_SPECIAL.sub(r"\\\1", text)
+
 
 class KnowledgeGraphClient(ABC):
     """Abstract base class for KG database clients."""
@@ -32,34 +97,77 @@ class KnowledgeGraphClient(ABC):
         pass
     
     @abstractmethod
-    async def execute_query(self, query: str, params: Optional[dict] = None) -> Any:
-        """Execute a query and return results."""
+    async def execute_query(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        coalesce: bool = False
+    ) -> Any:
+        """Execute a query and return results.
+        
+        With coalesce=True (read-only queries only), concurrent identical
+        calls may share a single round-trip.
+        """
+        pass
+    
+    @abstractmethod
+    def create_entity_repository(self) -> "EntityRepository":
+        """Create the entity repository backed by this client."""
         pass
 
 
 class Neo4jClient(KnowledgeGraphClient):
     """Neo4j database client with connection pooling."""
     
-    def __init__(self, uri: str, user: str, password: str, database: str = "neo4j"):
+    def __init__(
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        database: str = "neo4j",
+        pool_size: int = 100,
+        acquisition_timeout: float = 60.0,
+        query_timeout: float = 30.0
+    ):
         self.uri = uri
         self.user = user
         self.password = password
         self.database = database
         self.driver = None
-        self.max_connection_pool_size = 50
+        self.pool_size = pool_size
+        self.acquisition_timeout = acquisition_timeout
+        self.query_timeout = query_timeout
         self.connection_timeout = 30.0
+        self._breaker: Optional[CircuitBreaker] = None
+        # In-flight coalesced reads: (query, params repr) -> shared task
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+    
+    def create_entity_repository(self) -> "EntityRepository":
+        """Create a Neo4j entity repository on this client."""
+        # Imported here: the repository module imports this one
+        from ..repositories.entity_repository import Neo4jEntityRepository
+        return Neo4jEntityRepository(self)
     
     async def connect(self) -> None:
         """Establish connection to Neo4j."""
         try:
-            from neo4j import GraphDatabase
-            self.driver = GraphDatabase.driver(
+            from neo4j import AsyncGraphDatabase
+            from neo4j.exceptions import DriverError, TransientError
+            self.driver = AsyncGraphDatabase.driver(
                 self.uri,
                 auth=(self.user, self.password),
-                max_connection_pool_size=self.max_connection_pool_size,
+                max_connection_pool_size=self.pool_size,
+                connection_acquisition_timeout=self.acquisition_timeout,
+                max_connection_lifetime=3600,
                 connection_timeout=self.connection_timeout,
                 max_transaction_retry_time=10.0
             )
+            # Trip on connectivity/timeouts only, not on bad Cypher
+            self._breaker = CircuitBreaker(
+                failure_threshold=5,
+                recovery_timeout=10.0,
+                failure_types=(asyncio.TimeoutError, DriverError, TransientError)
+            )
             logger.info(f"Connected to Neo4j at {self.uri}")
         except ImportError:
             logger.warning("neo4j driver not installed, using mock mode")
@@ -70,7 +178,7 @@ class Neo4jClient(KnowledgeGraphClient):
     async def disconnect(self) -> None:
         """Close Neo4j connection."""
         if self.driver:
-            self.driver.close()
+            await self.driver.close()
             logger.info("Neo4j connection closed")
     
     async def health_check(self) -> bool:
@@ -78,21 +186,68 @@ class Neo4jClient(KnowledgeGraphClient):
         if not self.driver:
             return False
         try:
-            with self.driver.session(database=self.database) as session:
-                result = session.run("RETURN 1 AS health")
-                return result.single()["health"] == 1
+            async with self._breaker:
+                return await asyncio.wait_for(self._health_query(), self.query_timeout)
         except Exception as e:
             logger.error(f"Neo4j health check failed: {e}")
             return False
     
-    async def execute_query(self, query: str, params: Optional[dict] = None) -> Any:
-        """Execute Cypher query."""
+    async def _health_query(self) -> bool:
+        # Checks a pooled connection without opening a session or running
+        # a transaction; raises if Neo4j is unreachable
+        await self.driver.verify_connectivity()
+        return True
+    
+    async def execute_query(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        coalesce: bool = False
+    ) -> Any:
+        """Execute Cypher query.
+        
+        Fails fast with CircuitOpenError while Neo4j is failing, and
+        gives up after query_timeout seconds (client and server side).
+        With coalesce=True, concurrent calls with the same query and
+        params share one round-trip; each caller gets its own row dicts.
+        """
         if not self.driver:
             raise RuntimeError("Neo4j driver not connected")
         
-        with self.driver.session(database=self.database) as session:
-            result = session.run(query, parameters=params or {})
-            return [record.data() for record in result]
+        if not coalesce:
+            return await self._execute(query, params)
+        
+        key = (query, repr(sorted((params or {}).items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute(query, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: a cancelled caller must not cancel the shared query
+        rows = await asyncio.shield(task)
+        return [dict(row) for row in rows]
+    
+    async def _execute(self, query: str, params: Optional[dict]) -> Any:
+        async with self._breaker:
+            return await asyncio.wait_for(
+                self._run_query(query, params),
+                self.query_timeout
+            )
+    
+    async def _run_query(self, query: str, params: Optional[dict]) -> Any:
+        from neo4j import Query
+        
+        async with self.driver.session(database=self.database) as session:
+            result = await session.run(
+                Query(query, timeout=self.query_timeout),
+                parameters=params or {}
+            )
+            # Zip the raw values with the keys resolved once per result;
+            # record.data() rebuilds a dict (and converts nested graph
+            # types) per record. Nodes/relationships/paths are left as-is
+            # and serialized by the repository/query service.
+            keys = await result.keys()
+            return [dict(zip(keys, record)) async for record in result]
     
     async def ensure_indexes(self) -> None:
         """Create required indexes if they don't exist."""
@@ -101,27 +256,26 @@ class Neo4jClient(KnowledgeGraphClient):
             return
         
         try:
-            with self.driver.session(database=self.database) as session:
-                # Check if fulltext index exists
-                existing_indexes = session.run("SHOW INDEXES").data()
-                index_names = [idx.get("name") for idx in existing_indexes]
-                
-                if "entitySearch" not in index_names:
-                    logger.info("Creating fulltext index 'entitySearch'...")
-                    # Use CREATE FULLTEXT INDEX syntax (compatible with Neo4j Aura)
-                    # Index all searchable text properties for comprehensive search
-                    session.run("""
-                        CREATE FULLTEXT INDEX entitySearch IF NOT EXISTS
-                        FOR (n:Country|Disease|Outbreak|VaccinationRecord|Organization|Vaccine)
-                        ON EACH [n.name, n.fullName, n.label, n.description, n.summary, n.title, 
-                                 n.code, n.iso_code, n.icd10, n.mesh, n.category, n.pathogen,
-                                 n.causativeAgent, n.medicalSpecialty, n.prevention,
-                                 n.acronym, n.role, n.vaccineName, n.manufacturer,
-                                 n.capital, n.continent, n.wikipediaAbstract]
-                    """)
-                    logger.info("✓ Fulltext index 'entitySearch' created with comprehensive properties")
-                else:
-                    logger.info("✓ Fulltext index 'entitySearch' already exists")
+            async with self.driver.session(database=self.database) as session:
+                # IF NOT EXISTS makes this idempotent, so no SHOW INDEXES
+                # round-trip is needed first.
+                for name, ddl in (
+                    ("entitySearch", ENTITY_SEARCH_DDL),
+                    (KEYWORD_SEARCH_INDEX, KEYWORD_SEARCH_DDL),
+                ):
+                    result = await session.run(ddl)
+                    summary = await result.consume()
+                    if summary.counters.indexes_added:
+                        logger.info(f"✓ Fulltext index '{name}' created")
+                    else:
+                        logger.info(f"✓ Fulltext index '{name}' already exists")
+                for ddl in PROPERTY_INDEX_DDL:
+                    try:
+                        result = await session.run(ddl)
+                        await result.consume()
+                    except Exception as e:
+                        # e.g. a uniqueness constraint already indexes it
+                        logger.info(f"Skipped range index ({ddl}): {e}")
                 
         except Exception as e:
             logger.error(f"Failed to create indexes: {e}")
@@ -0,0 +1,32 @@
+"""Searchable text of a knowledge-graph node.
+
+Single definition of the lower-cased concatenation that keyword search
+matches words against. The ETL (kg-construction/etl/neo4j_connection.py)
+stores it as n.searchText, and search() evaluates it for nodes loaded
+before that property existed.
+
+The ETL loads this file by path, so it must only use the standard library.
+"""
+
+# Scalar properties, concatenated in this order
+SEARCH_TEXT_PROPERTIES = (
+    "name", "fullName", "id", "label", "code", "description",
+    "wikipediaAbstract", "category", "icd10", "mesh", "continent", "capital",
+    "acronym", "vaccineName", "manufacturer", "role",
+)
+
+# List properties, each joined into a space-separated string
+SEARCH_TEXT_LIST_PROPERTIES = (
+    "symptoms", "drugs", "treatments", "possibleTreatments",
+    "transmissionMethods", "riskFactors",
+)
+
+# Cypher expression over node `n`
+SEARCH_TEXT_EXPRESSION = "toLower(" + " + ' ' + ".join(
+    [f"COALESCE(n.{prop}, '')" for prop in SEARCH_TEXT_PROPERTIES]
+    + ["COALESCE(toString(n.year), '')"]
+    + [
+        f"REDUCE(s = '', x IN COALESCE(n.{prop}, []) | s + ' ' + x)"
+        for prop in SEARCH_TEXT_LIST_PROPERTIES
+    ]
+) + ")"
@@ -14,14 +14,17 @@ For production:
 - Add caching layer (Redis)
 - Add observability (Prometheus, OpenTelemetry)
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from typing import Optional
+import asyncio
 import logging
+import time
 
 from .config.settings import settings
 from .core.dependencies import container
-from .routers import search, entity, query, admin, summary, heatmap
-from .routers import search, entity, query, admin, summary, chat
+from .routers import search, entity, query, admin, summary, heatmap, chat
 
 # Configure logging
 logging.basicConfig(
@@ -30,16 +33,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Readiness probes reuse the last KG health result for this many seconds
+HEALTH_TTL = 1.5
+_last_health: Optional[tuple[float, bool]] = None
+_health_lock = asyncio.Lock()
+# Lets an upstream proxy/browser answer repeated liveness probes itself
+HEALTH_CACHE_CONTROL = "public, max-age=1"
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=list(settings.cors_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -51,12 +62,9 @@ async def startup_event():
     """Initialize resources on application startup."""
     logger.info("Starting up application...")
     
-    # Initialize dependency container (connects to Neo4j)
+    # Initialize dependency container (connects to Neo4j, ensures indexes)
     await container.init_resources()
-    
-    # Ensure required indexes exist
-    kg_client = container.get_kg_client()
-    await kg_client.ensure_indexes()
+    app.state.kg_client = container.get_kg_client()
     
     logger.info("Application started successfully")
 
@@ -106,24 +114,57 @@ app.include_router(
 )
 
 
+def _cacheable_json(request: Request, content: dict, etag: str) -> Response:
+    """JSON response that proxies/browsers may cache for HEALTH_CACHE_CONTROL.
+    
+    Answers 304 when the client already holds the same ETag.
+    """
+    headers = {"Cache-Control": HEALTH_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(content, headers=headers)
+
+
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Basic health check endpoint."""
-    return {"status": "healthy", "version": settings.app_version}
+    return _cacheable_json(
+        request,
+        {"status": "healthy", "version": settings.app_version},
+        etag=f'"health-{settings.app_version}"'
+    )
+
+
+async def _kg_health() -> bool:
+    """KG health, cached for HEALTH_TTL; concurrent probes share one query."""
+    global _last_health
+    if _last_health and time.monotonic() - _last_health[0] < HEALTH_TTL:
+        return _last_health[1]
+    async with _health_lock:
+        # Another probe may have refreshed it while we waited for the lock
+        if _last_health and time.monotonic() - _last_health[0] < HEALTH_TTL:
+            return _last_health[1]
+        healthy = await app.state.kg_client.health_check()
+        _last_health = (time.monotonic(), healthy)
+        return healthy
 
 
 @app.get("/health/ready")
 async def readiness_check():
     """Readiness check (includes database health)."""
-    kg_client = container.get_kg_client()
-    kg_healthy = await kg_client.health_check()
+    kg_healthy = await _kg_health()
     
-    return {
-        "status": "ready" if kg_healthy else "not_ready",
-        "checks": {
-            "knowledge_graph": "healthy" if kg_healthy else "unhealthy"
-        }
-    }
+    # Never cached outside this process (a proxy could keep serving
+    # "ready" after the database goes down); _kg_health's TTL is enough
+    return ORJSONResponse(
+        {
+            "status": "ready" if kg_healthy else "not_ready",
+            "checks": {
+                "knowledge_graph": "healthy" if kg_healthy else "unhealthy"
+            }
+        },
+        headers={"Cache-Control": "no-store"}
+    )
 
 
 @app.get("/")
@@ -1,13 +1,26 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
+class FrozenModel(BaseModel):
+    """Base for read-only models: built once per response, never mutated."""
+    model_config = ConfigDict(frozen=True)
+
+
+class DeferredModel(FrozenModel):
+    """Read-only model whose validator is built on first use, not at import.
+    
+    For models no route declares, so app startup doesn't pay for them.
+    """
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
 # ============================================================================
 # Entity Models (matching actual Neo4j schema)
 # ============================================================================
 
-class Country(BaseModel):
+class Country(DeferredModel):
     """Country node from Neo4j"""
     code: str  # ISO 3166-1 alpha-3 (e.g., "USA")
     name: str
@@ -27,7 +40,7 @@ class Country(BaseModel):
     enrichedAt: Optional[datetime] = None
 
 
-class Disease(BaseModel):
+class Disease(DeferredModel):
     """Disease node from Neo4j"""
     id: str  # e.g., "covid19", "malaria"
     name: str
@@ -38,10 +51,11 @@ class Disease(BaseModel):
     fullName: Optional[str] = None
     icd10: Optional[str] = None
     mesh: Optional[str] = None
-    symptoms: Optional[List[str]] = None
-    transmissionMethods: Optional[List[str]] = None
-    riskFactors: Optional[List[str]] = None
-    treatments: Optional[List[str]] = None
+    # Immutable, and the shared empty tuple when the property is missing
+    symptoms: tuple[str, ...] = ()
+    transmissionMethods: tuple[str, ...] = ()
+    riskFactors: tuple[str, ...] = ()
+    treatments: tuple[str, ...] = ()
     incubationPeriod: Optional[str] = None
     description: Optional[str] = None
     category: Optional[str] = None
@@ -60,7 +74,7 @@ class Disease(BaseModel):
     dbpediaEnriched: Optional[bool] = False
 
 
-class Outbreak(BaseModel):
+class Outbreak(DeferredModel):
     """Outbreak node from Neo4j"""
     id: str  # e.g., "covid_USA_20200302"
     year: int
@@ -76,7 +90,7 @@ class Outbreak(BaseModel):
     confidenceIntervalBottom: Optional[float] = None
 
 
-class VaccinationRecord(BaseModel):
+class VaccinationRecord(DeferredModel):
     """Vaccination record node from Neo4j"""
     id: str
     year: int
@@ -85,7 +99,7 @@ class VaccinationRecord(BaseModel):
     totalVaccinated: Optional[int] = None
 
 
-class Organization(BaseModel):
+class Organization(DeferredModel):
     """Health organization node (from enrichment)"""
     id: str  # e.g., "who", "cdc"
     name: str
@@ -97,7 +111,7 @@ class Organization(BaseModel):
     website: Optional[str] = None
 
 
-class Vaccine(BaseModel):
+class Vaccine(DeferredModel):
     """Vaccine node (from enrichment)"""
     wikidataId: str
     name: str
@@ -110,7 +124,7 @@ class Vaccine(BaseModel):
 # API Request/Response Models
 # ============================================================================
 
-class EntitySummary(BaseModel):
+class EntitySummary(FrozenModel):
     """Lightweight entity for search results"""
     id: str
     label: str
@@ -119,14 +133,14 @@ class EntitySummary(BaseModel):
     snippet: Optional[str] = None
 
 
-class Relation(BaseModel):
+class Relation(FrozenModel):
     """Relationship to another entity"""
     predicate: str  # Relationship type (e.g., "CAUSED_BY", "OCCURRED_IN")
     direction: str  # "incoming" or "outgoing"
     object: Dict[str, Any]  # {id, label, type}
 
 
-class EntityDetail(BaseModel):
+class EntityDetail(FrozenModel):
     """Full entity details for InfoBox"""
     id: str
     label: str
@@ -134,46 +148,45 @@ class EntityDetail(BaseModel):
     properties: Dict[str, Any]
     relations: Optional[List[Relation]] = []
     
-    class Config:
-        # Allow arbitrary types for flexibility
-        arbitrary_types_allowed = True
+    # Allow arbitrary types for flexibility
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
 
 
-class SearchResponse(BaseModel):
+class SearchResponse(DeferredModel):
     results: List[EntitySummary]
     total: Optional[int] = None
 
 
-class ChatRequest(BaseModel):
+class ChatRequest(FrozenModel):
     message: str
     session_id: Optional[str] = None
     include_history: Optional[bool] = True
 
 
-class ChatResponse(BaseModel):
+class ChatResponse(FrozenModel):
     message: str
     sources: Optional[List[Dict[str, Any]]] = None
     session_id: Optional[str] = None
 
 
-class QueryRequest(BaseModel):
+class QueryRequest(FrozenModel):
     query: str
     type: str = "cypher"  # Only Cypher queries supported (Neo4j)
 
 
-class QueryResponse(BaseModel):
+class QueryResponse(FrozenModel):
     columns: List[str]
     rows: List[List[Any]]  # Each row is a list of values matching column order
     count: int
 
 
-class SummaryRequest(BaseModel):
+class SummaryRequest(DeferredModel):
     entity_id: str
     query: Optional[str] = None
     include_relations: Optional[bool] = True
 
 
-class SummaryResponse(BaseModel):
+class SummaryResponse(DeferredModel):
     summary: str
     entity_id: str
     metadata: Optional[Dict[str, Any]] = None
@@ -2,6 +2,7 @@
 Real Cypher Query Examples
 Based on actual Neo4j schema from kg-construction/
 """
+import orjson
 
 # ============================================================================
 # EXAMPLE CYPHER QUERIES (for Query Console)
@@ -187,6 +188,22 @@ LIMIT 20
 ]
 
 
+# Category index, built once at import
+_BY_CATEGORY = {}
+for _example in CYPHER_EXAMPLES:
+    _BY_CATEGORY.setdefault(_example["category"], []).append(_example)
+_BY_CATEGORY = {category: tuple(examples) for category, examples in _BY_CATEGORY.items()}
+_CATEGORIES = tuple(_BY_CATEGORY)
+del _example
+
+# Examples never change at runtime, so serialize them once
+_EXAMPLES_JSON = orjson.dumps(CYPHER_EXAMPLES)
+_BY_CATEGORY_JSON = {
+    category: orjson.dumps(examples) for category, examples in _BY_CATEGORY.items()
+}
+_EMPTY_JSON = b"[]"
+
+
 def get_example_queries(category=None):
     """
     Get example Cypher queries
@@ -195,13 +212,28 @@ def get_example_queries(category=None):
         category: Optional category filter
         
     Returns:
-        List of query examples
+        Sequence of query examples (shared; do not mutate)
     """
     if category:
-        return [q for q in CYPHER_EXAMPLES if q["category"] == category]
+        return _BY_CATEGORY.get(category, ())
     return CYPHER_EXAMPLES
 
 
+def get_examples_json(category=None) -> bytes:
+    """
+    Get example Cypher queries as pre-serialized JSON
+    
+    Args:
+        category: Optional category filter
+        
+    Returns:
+        JSON array bytes, ready to send as a response body
+    """
+    if category:
+        return _BY_CATEGORY_JSON.get(category, _EMPTY_JSON)
+    return _EXAMPLES_JSON
+
+
 def get_query_categories():
-    """Get list of unique query categories"""
-    return list(set(q["category"] for q in CYPHER_EXAMPLES))
+    """Get unique query categories, in first-seen order"""
+    return _CATEGORIES
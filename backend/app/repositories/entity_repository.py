@@ -5,15 +5,345 @@ Following Google's backend best practices:
 - Allow switching between KG backends
 - Single responsibility principle
 """
-from typing import Optional, Dict, Any, List
-from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any, List, Tuple, Protocol, Callable
 from datetime import datetime, date, time
+from functools import lru_cache
 import logging
+import re
 
-from ..db.kg_client import KnowledgeGraphClient
+from ..db.kg_client import (
+    KnowledgeGraphClient, FULLTEXT_LABELS, KEYWORD_SEARCH_INDEX, escape_fulltext_query
+)
+from ..db.search_text import SEARCH_TEXT_EXPRESSION
+from ..core.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Cache-miss marker (None is a valid cached get_by_id result)
+_MISSING = object()
+
+# Deepest traversal get_related will build a query for
+MAX_RELATED_DEPTH = 3
+
+# Upper bound on index candidates that search() scores in Cypher
+SEARCH_CANDIDATES = 500
+
+# Query words that name an entity type; search() scores every node of
+# that type, so those nodes are candidates regardless of the index
+_TYPE_WORDS = {
+    "disease": "Disease", "diseases": "Disease",
+    "country": "Country", "countries": "Country",
+    "outbreak": "Outbreak", "outbreaks": "Outbreak",
+    "vaccine": "Vaccine", "vaccines": "Vaccine",
+    "vaccination": "VaccinationRecord", "vaccinations": "VaccinationRecord",
+    "organization": "Organization", "organisations": "Organization",
+}
+
+# Node properties minus the internal ones (embedding vector, precomputed
+# search text), as [key, value] pairs (Cypher has no built-in way to drop
+# a map key); rebuild with dict(). Keeps them from being sent over the
+# wire at all. get_by_id and get_by_ids use the same for node `e`.
+_DISPLAY_PROPERTIES = "[k IN keys(n) WHERE NOT k IN ['embedding', 'searchText'] | [k, n[k]]]"
+
+def _description_snippet(props: Dict[str, Any]) -> str:
+    return (props.get('description') or '')[:150]
+
+
+def _disease_snippet(props: Dict[str, Any]) -> str:
+    symptoms = props.get('symptoms')
+    if symptoms:
+        return 'Symptoms: ' + ', '.join(symptoms[:3])
+    return _description_snippet(props)
+
+
+def _country_snippet(props: Dict[str, Any]) -> str:
+    capital = props.get('capital')
+    return (props.get('continent') or '') + (f' | Capital: {capital}' if capital is not None else '')
+
+
+def _vaccine_snippet(props: Dict[str, Any]) -> str:
+    manufacturer = props.get('manufacturer')
+    return f'Manufacturer: {manufacturer}' if manufacturer is not None else ''
+
+
+def _outbreak_snippet(props: Dict[str, Any]) -> str:
+    cases, deaths = props.get('cases'), props.get('deaths')
+    return (
+        (f'{cases} cases' if cases is not None else '') +
+        (f', {deaths} deaths' if deaths is not None else '')
+    )
+
+
+# One-line summary per entity type for search results, built from the
+# returned properties rather than as per-row string work in Cypher
+_SNIPPETS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    'Disease': _disease_snippet,
+    'Country': _country_snippet,
+    'Organization': lambda props: props.get('role') or '',
+    'Vaccine': _vaccine_snippet,
+    'Outbreak': _outbreak_snippet,
+}
+
+
+def _snippet(entity_type: Optional[str], props: Dict[str, Any]) -> str:
+    return _SNIPPETS.get(entity_type, _description_snippet)(props)
+
+
+# Plain words (no punctuation) can be used as Lucene terms unescaped
+_PLAIN_WORD = re.compile(r"\w+")
+
+
+def _lucene_query(words: List[str]) -> str:
+    """Lucene query for the keyword index: any word, exact or as a prefix.
+    
+    Exact term hits are boosted so they rank first among the candidates.
+    Words with punctuation ("covid-19") become escaped phrase queries, so
+    they match their analyzed tokens side by side rather than each token
+    anywhere; words without any word characters are skipped.
+    """
+    terms = []
+    for w in dict.fromkeys(words):
+        if _PLAIN_WORD.fullmatch(w):
+            terms.append(f"{w}^2 OR {w}*")
+        elif _PLAIN_WORD.search(w):
+            terms.append(f'"{escape_fulltext_query(w)}"^2')
+    return " OR ".join(terms)
+
+
+@lru_cache(maxsize=64)
+def _search_query(
+    use_index: bool,
+    type_labels: Tuple[str, ...],
+    entity_type: Optional[str]
+) -> str:
+    """Cypher for search() for one candidate/filter shape.
+    
+    Args:
+        use_index: Take candidates from the keyword fulltext index;
+            otherwise scan all nodes of the searched labels
+        type_labels: Labels named by the query words, all of whose nodes
+            are candidates (index queries only)
+        entity_type: Restrict results to this label (None = all)
+    
+    Labels cannot be query parameters, so callers pass only known labels
+    (FULLTEXT_LABELS, or _BROWSER_LABELS for entity_type). Built once per shape: the text stays byte-identical
+    across calls (one server-side plan each) and the rest is parameters.
+    """
+    if use_index:
+        # Candidates: fulltext index hits, plus all nodes of any entity
+        # type named in the query (those score on the type word alone)
+        branches = [f"""
+            CALL db.index.fulltext.queryNodes('{KEYWORD_SEARCH_INDEX}', $luceneQuery, {{limit: $candidates}})
+            YIELD node
+            RETURN node AS n"""]
+        if type_labels:
+            branches.append(f"""
+            MATCH (n)
+            WHERE {' OR '.join(f'n:{label}' for label in type_labels)}
+            RETURN n""")
+        candidates = "CALL {" + "\n            UNION".join(branches) + "\n        }"
+    else:
+        # Label scan: every node is scored (finds infix/substring matches
+        # the index cannot, and works while the index is missing)
+        candidates = "MATCH (n)"
+    
+    # Build WHERE clause based on filters
+    if entity_type:
+        # Filter by specific type
+        type_filter = f"WHERE n:{entity_type}"
+    else:
+        # Default: search all entity types
+        type_filter = """WHERE n:Country OR n:Disease OR n:Outbreak OR n:Organization 
+           OR n:Vaccine OR n:VaccinationRecord"""
+    
+    # Comprehensive search with efficient multi-word handling
+    return f"""
+        {candidates}
+        WITH n
+        {type_filter}
+        
+        // Searchable text from all important properties: precomputed by
+        // the ETL (kg-construction build_search_text), else built here
+        WITH n,
+             CASE WHEN n.searchText IS NOT NULL THEN n.searchText
+                  ELSE {SEARCH_TEXT_EXPRESSION} END as searchText
+        
+        // Lower-cased short fields the scoring compares against, once per
+        // node rather than once per word (descriptions and list properties
+        // are only lowered for words that already matched searchText)
+        WITH n, searchText, labels(n) as nodeLabels,
+             toLower(COALESCE(n.name, '')) as nameLower,
+             toLower(COALESCE(n.fullName, '')) as fullNameLower,
+             toLower(COALESCE(n.id, '')) as idLower,
+             toLower(COALESCE(n.code, '')) as codeLower,
+             toLower(COALESCE(n.icd10, '')) as icd10Lower,
+             toLower(COALESCE(n.mesh, '')) as meshLower,
+             toLower(COALESCE(n.vaccineName, '')) as vaccineNameLower,
+             toLower(COALESCE(n.acronym, '')) as acronymLower
+        
+        // Multi-word scoring: sum up individual word scores. $wordSpecs
+        // pairs each word with the entity label it names, if any
+        WITH n, searchText,
+             REDUCE(totalScore = 0.0, spec IN $wordSpecs |
+                 totalScore + CASE
+                     // Exact entity type match
+                     WHEN spec.label IN nodeLabels THEN 9.0
+                     
+                     // Exact property matches (highest value)
+                     WHEN nameLower = spec.word THEN 10.0
+                     WHEN idLower = spec.word THEN 10.0
+                     WHEN codeLower = spec.word THEN 10.0
+                     
+                     // Property starts with word (high value)
+                     WHEN nameLower STARTS WITH spec.word THEN 8.0
+                     WHEN fullNameLower STARTS WITH spec.word THEN 8.0
+                     WHEN idLower STARTS WITH spec.word THEN 7.0
+                     
+                     // Word appears in searchText (main matching)
+                     WHEN searchText CONTAINS spec.word THEN 
+                         CASE
+                             // Boost if in high-priority fields
+                             WHEN nameLower CONTAINS spec.word THEN 6.0
+                             WHEN fullNameLower CONTAINS spec.word THEN 6.0
+                             WHEN icd10Lower CONTAINS spec.word THEN 7.0
+                             WHEN meshLower CONTAINS spec.word THEN 7.0
+                             WHEN vaccineNameLower CONTAINS spec.word THEN 6.0
+                             WHEN acronymLower CONTAINS spec.word THEN 6.0
+                             // Arrays
+                             WHEN ANY(x IN COALESCE(n.symptoms, []) WHERE toLower(x) CONTAINS spec.word) THEN 5.5
+                             WHEN ANY(x IN COALESCE(n.drugs, []) WHERE toLower(x) CONTAINS spec.word) THEN 5.5
+                             WHEN ANY(x IN COALESCE(n.treatments, []) WHERE toLower(x) CONTAINS spec.word) THEN 5.5
+                             WHEN ANY(x IN COALESCE(n.possibleTreatments, []) WHERE toLower(x) CONTAINS spec.word) THEN 5.5
+                             // Descriptions and other fields
+                             WHEN toLower(COALESCE(n.description, '')) CONTAINS spec.word THEN 4.0
+                             WHEN toLower(COALESCE(n.wikipediaAbstract, '')) CONTAINS spec.word THEN 4.0
+                             ELSE 3.0  // Found in searchText but lower priority field
+                         END
+                     ELSE 0.0  // Word not found
+                 END
+             ) as match_score
+        
+        // Filter: Must match at least one word (OR logic)
+        // Multi-word matches will naturally score higher
+        WHERE match_score > 0
+        
+        // Boost multi-word matches where words appear close together
+        WITH n, match_score,
+             CASE 
+                 WHEN size($words) > 1 AND searchText CONTAINS $fullQuery 
+                 THEN match_score * 1.5  // Exact phrase bonus
+                 ELSE match_score
+             END as final_score
+        
+        // Create entity representation
+        WITH n, final_score,
+        CASE 
+            WHEN n:Disease THEN COALESCE(n.fullName, n.name, n.id)
+            WHEN n:Country THEN COALESCE(n.name, n.code)
+            WHEN n:Organization THEN COALESCE(n.name, n.acronym)
+            WHEN n:Vaccine THEN COALESCE(n.name, n.vaccineName, n.label)
+            WHEN n:Outbreak THEN COALESCE(n.id, n.label)
+            WHEN n:VaccinationRecord THEN COALESCE(n.name, n.label, n.id, n.code)
+            WHEN n:PandemicEvent THEN COALESCE(n.name, n.label, n.title)
+            ELSE COALESCE(n.name, n.label, n.title, n.id)
+        END as entity_label
+        
+        // Return matched entities as flat columns (one row per result)
+        RETURN elementId(n) as id,
+               entity_label as label,
+               head(labels(n)) as type,
+               {_DISPLAY_PROPERTIES} as properties,
+               final_score as score
+        
+        ORDER BY score DESC, label ASC
+        LIMIT $limit
+        """
+
+
+# Entity browser type names -> labels
+_BROWSER_LABELS = {
+    "country": "Country",
+    "disease": "Disease",
+    "outbreak": "Outbreak",
+    "vaccinationrecord": "VaccinationRecord",
+    "organization": "Organization",
+    "vaccine": "Vaccine",
+    "pandemicevent": "PandemicEvent"
+}
+
+
+@lru_cache(maxsize=32)
+def _by_type_query(label: str, with_search: bool, sort_by_id: bool) -> str:
+    """Cypher for get_by_type for one label/search/sort shape.
+    
+    Labels cannot be query parameters, so callers pass only labels from
+    _BROWSER_LABELS. Search text, property filters and limit are
+    parameters, so the text (and its cached plan) is reused across calls.
+    """
+    # Build search condition
+    search_condition = ""
+    if with_search:
+        search_condition = """
+        AND (
+            toLower(COALESCE(n.name, '')) CONTAINS $search
+            OR toLower(COALESCE(n.fullName, '')) CONTAINS $search
+            OR toLower(COALESCE(n.label, '')) CONTAINS $search
+            OR toLower(COALESCE(n.id, '')) CONTAINS $search
+            OR toLower(COALESCE(n.code, '')) CONTAINS $search
+            OR toLower(COALESCE(n.description, '')) CONTAINS $search
+        )
+        """
+
+    # Build sort expression
+    if sort_by_id:
+        sort_expr = "COALESCE(n.id, n.code, elementId(n))"
+    else:  # default to name
+        sort_expr = "COALESCE(n.name, n.fullName, n.label, n.id, n.code, elementId(n))"
+
+    return f"""
+        MATCH (n:{label})
+        WHERE all(f IN $filters WHERE n[f.key] = f.value) {search_condition}
+
+        WITH n, {sort_expr} as sortValue
+
+        RETURN {{
+            id: elementId(n),
+            label: COALESCE(n.name, n.id, n.code, elementId(n)),
+            type: head(labels(n)),
+            description: COALESCE(n.description, n.wikipediaAbstract, ''),
+            properties: {_DISPLAY_PROPERTIES}
+        }} as entity
+
+        ORDER BY sortValue ASC
+        LIMIT $limit
+        """
+
+
+@lru_cache(maxsize=MAX_RELATED_DEPTH)
+def _related_query(max_depth: int) -> str:
+    """Cypher for get_related at a given depth.
+    
+    Neo4j doesn't allow parameters in variable-length relationship
+    patterns, so the depth is a literal. Building the text once per depth
+    keeps it byte-identical across calls (one server-side plan each).
+    The elementId() predicate is planned as a direct node seek.
+    
+    No relationship/path variable is bound and only DISTINCT end nodes are
+    kept, so the planner can use a pruning var-length expand (one row per
+    reachable node rather than one per path), and LIMIT stops it early.
+    """
+    return f"""
+        MATCH (e)-[*1..{max_depth}]-(related)
+        WHERE elementId(e) = $entity_id
+        WITH DISTINCT related
+        LIMIT 50
+        RETURN {{
+            id: elementId(related),
+            label: COALESCE(related.name, related.label, related.id, related.code, elementId(related)),
+            type: head(labels(related))
+        }} as entity
+        """
+
 
 def serialize_neo4j_types(value: Any) -> Any:
     """
@@ -27,60 +357,160 @@ def serialize_neo4j_types(value: Any) -> Any:
     - Node → dict of properties
     - Relationship → dict of properties
     - Lists and nested structures
+    
+    Dispatches on the exact type; the handler for a type seen for the
+    first time is resolved once (_resolve_serializer) and remembered.
     """
-    # None and primitives
-    if value is None or isinstance(value, (str, int, float, bool)):
-        return value
+    handler = _SERIALIZERS.get(type(value))
+    if handler is None:
+        handler = _SERIALIZERS[type(value)] = _resolve_serializer(value)
+    return handler(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _isoformat(value: Any) -> str:
+    return value.isoformat()
+
+
+def _iso_format(value: Any) -> str:
+    return value.iso_format()
+
+
+def _point(value: Any) -> Dict[str, Any]:
+    return {
+        'latitude': value.latitude,
+        'longitude': value.longitude
+    }
+
+
+def _graph_entity(value: Any) -> Dict[str, Any]:
+    # Node/Relationship: serialize their properties
+    return {k: serialize_neo4j_types(v) for k, v in value.items()}
+
+
+def _list(value: Any) -> List[Any]:
+    return [serialize_neo4j_types(item) for item in value]
+
+
+def _dict(value: Any) -> Dict[str, Any]:
+    return {k: serialize_neo4j_types(v) for k, v in value.items()}
+
+
+try:
+    from neo4j.time import Date, DateTime, Time, Duration
+    from neo4j.spatial import WGS84Point
+    from neo4j.graph import Node, Relationship
+    _NEO4J_TEMPORAL: Tuple[type, ...] = (Date, DateTime, Time, Duration)
+    _NEO4J_GEO_POINT: Tuple[type, ...] = (WGS84Point,)
+    _NEO4J_ENTITY: Tuple[type, ...] = (Node, Relationship)
+except ImportError:  # driver not installed: no such values to serialize
+    _NEO4J_TEMPORAL = _NEO4J_GEO_POINT = _NEO4J_ENTITY = ()
+
+_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {
+    type(None): _identity,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    datetime: _isoformat,
+    date: _isoformat,
+    time: _isoformat,
+    list: _list,
+    dict: _dict,
+    **dict.fromkeys(_NEO4J_TEMPORAL, _iso_format),
+    **dict.fromkeys(_NEO4J_GEO_POINT, _point),
+}
+
+
+def _resolve_serializer(value: Any) -> Callable[[Any], Any]:
+    """Pick the handler for a type not yet in _SERIALIZERS."""
+    # Primitives (and their subclasses)
+    if isinstance(value, (str, int, float, bool)):
+        return _identity
     
     # Python datetime objects
     if isinstance(value, (datetime, date, time)):
-        return value.isoformat()
+        return _isoformat
     
-    # Neo4j temporal types (have iso_format method)
-    if hasattr(value, 'iso_format'):
-        return value.iso_format()
+    # Neo4j temporal types
+    if isinstance(value, _NEO4J_TEMPORAL):
+        return _iso_format
     
-    # Neo4j Date/DateTime/Time (alternative check)
-    type_name = type(value).__name__
-    if type_name in ('Date', 'DateTime', 'Time', 'Duration'):
-        return str(value)
+    # Neo4j geographic Point (Cartesian points fall back to str)
+    if isinstance(value, _NEO4J_GEO_POINT):
+        return _point
     
-    # Neo4j Point (spatial)
-    if hasattr(value, 'latitude') and hasattr(value, 'longitude'):
-        return {
-            'latitude': value.latitude,
-            'longitude': value.longitude
-        }
-    
-    # Neo4j Node
-    if hasattr(value, 'labels') and hasattr(value, 'items'):
-        return {k: serialize_neo4j_types(v) for k, v in dict(value).items()}
-    
-    # Neo4j Relationship
-    if hasattr(value, 'type') and hasattr(value, 'items'):
-        return {k: serialize_neo4j_types(v) for k, v in dict(value).items()}
+    # Neo4j Node / Relationship (relationships are per-type subclasses)
+    if isinstance(value, _NEO4J_ENTITY):
+        return _graph_entity
     
     # Lists
     if isinstance(value, list):
-        return [serialize_neo4j_types(item) for item in value]
+        return _list
     
     # Dicts
     if isinstance(value, dict):
-        return {k: serialize_neo4j_types(v) for k, v in value.items()}
+        return _dict
     
     # Fallback: convert to string
-    return str(value)
+    return str
+
+
+def _related_row(entity: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialize a get_related row: {id, label, type}.
+    
+    id and type are strings (elementId/label name); label is a property
+    value that is nearly always a string, so only other values go through
+    serialize_neo4j_types.
+    """
+    label = entity["label"]
+    return {
+        "id": entity["id"],
+        "label": label if type(label) is str else serialize_neo4j_types(label),
+        "type": entity["type"]
+    }
 
 
-class EntityRepository(ABC):
-    """Abstract repository for entity operations."""
+def _entity_row(entity: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialize a get_by_id row: {id, label, type, properties, relations}.
+    
+    The shape is fixed by the query, so only property values and labels
+    go through the type dispatch.
+    """
+    label = entity["label"]
+    return {
+        "id": entity["id"],
+        "label": label if type(label) is str else serialize_neo4j_types(label),
+        "type": entity["type"],
+        "properties": {k: serialize_neo4j_types(v) for k, v in entity["properties"] or ()},
+        "relations": [
+            {
+                "predicate": r["predicate"],
+                "direction": r["direction"],
+                "object": _related_row(r["object"])
+            }
+            for r in entity["relations"] or ()
+        ]
+    }
+
+
+class EntityRepository(Protocol):
+    """Interface for entity operations.
+    
+    Structural: implementations match these signatures without subclassing.
+    """
     
-    @abstractmethod
     async def get_by_id(self, entity_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve entity by ID."""
-        pass
+        ...
+    
+    async def get_by_ids(self, entity_ids: List[str]) -> List[Dict[str, Any]]:
+        """Retrieve several entities by ID (without relations), in input order."""
+        ...
     
-    @abstractmethod
     async def search(
         self,
         query: str,
@@ -94,14 +524,12 @@ class EntityRepository(ABC):
             limit: Maximum number of results
             filters: Optional filters (e.g., {"type": "Disease"})
         """
-        pass
+        ...
     
-    @abstractmethod
     async def get_related(self, entity_id: str, max_depth: int = 1) -> List[Dict[str, Any]]:
         """Get entities related to given entity."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_by_type(
         self,
         entity_type: str,
@@ -111,18 +539,16 @@ class EntityRepository(ABC):
         filters: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """Get all entities of a specific type with optional search and sorting."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_countries_for_entity(
         self,
         entity_id: str,
         data_type: str = "outbreaks"
     ) -> List[Dict[str, Any]]:
         """Get list of countries that have data for a specific entity (disease)."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_timeseries_data(
         self,
         entity_id: str,
@@ -133,23 +559,53 @@ class EntityRepository(ABC):
         aggregation: str = "country"
     ) -> List[Dict[str, Any]]:
         """Get time-series data for outbreaks or vaccinations."""
-        pass
+        ...
 
-    @abstractmethod
     async def get_heatmap_data(
         self,
         disease_id: str,
         year: Optional[int] = None
     ) -> Dict[str, Any]:
         """Get heatmap data for world map visualization."""
-        pass
+        ...
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss counters of the read caches, by method."""
+        ...
 
 
-class Neo4jEntityRepository(EntityRepository):
+class Neo4jEntityRepository:
     """Neo4j implementation of entity repository."""
     
     def __init__(self, client: KnowledgeGraphClient):
         self.client = client
+        # Popular searches repeat; keep recent results briefly
+        self._search_cache = TTLCache(maxsize=512, ttl=60.0)
+        # Entities are revisited while exploring the graph (open, follow a
+        # neighbor, go back). The KG only changes through offline imports,
+        # so these (and the per-disease chart data) can live longer.
+        self._entity_cache = TTLCache(maxsize=1024, ttl=600.0)
+        self._related_cache = TTLCache(maxsize=1024, ttl=600.0)
+        self._type_cache = TTLCache(maxsize=256, ttl=300.0)
+        self._countries_cache = TTLCache(maxsize=512, ttl=600.0)
+        self._heatmap_cache = TTLCache(maxsize=512, ttl=600.0)
+    
+    def invalidate(self, entity_id: str) -> None:
+        """Drop cached get_by_id/get_related results for an entity."""
+        self._entity_cache.discard(entity_id)
+        for depth in range(1, MAX_RELATED_DEPTH + 1):
+            self._related_cache.discard((entity_id, depth))
+    
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss counters of the read caches, by method."""
+        return {
+            "search": self._search_cache.stats(),
+            "get_by_id": self._entity_cache.stats(),
+            "get_related": self._related_cache.stats(),
+            "get_by_type": self._type_cache.stats(),
+            "get_countries_for_entity": self._countries_cache.stats(),
+            "get_heatmap_data": self._heatmap_cache.stats(),
+        }
     
     async def get_by_id(self, entity_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -161,68 +617,93 @@ class Neo4jEntityRepository(EntityRepository):
         - type: Node label (Disease, Country, Outbreak, etc.)
         - properties: All node properties as dict
         - relations: Array of {predicate, object} relationships
+        
+        Results (including "not found") are cached briefly; the returned
+        dict is shared, so callers must not modify it.
         """
-        # Query to get node with all properties using elementId
+        cached = self._entity_cache.get(entity_id, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        
+        # Query to get node with all properties using elementId. Element
+        # IDs are what the API hands out; the planner resolves
+        # elementId(e) = $param with a direct node seek, not a scan, so no
+        # property index is needed for these lookups.
         query = """
         MATCH (e)
         WHERE elementId(e) = $entity_id
         
         // Get all properties
-        WITH e, labels(e) as nodeLabels, properties(e) as props
+        // (as [key, value] pairs, without embedding/searchText)
+        WITH e, labels(e) as nodeLabels,
+             [k IN keys(e) WHERE NOT k IN ['embedding', 'searchText'] | [k, e[k]]] as props
         
-        // Get all relationships
-        OPTIONAL MATCH (e)-[r]->(related)
-        WITH e, nodeLabels, props, 
-             collect(DISTINCT {
+        // Get all relationships in one expand; direction comes from the
+        // relationship itself. collect() drops the null produced when
+        // there are none, so no empty relation is returned.
+        OPTIONAL MATCH (e)-[r]-(related)
+        WITH e, nodeLabels, props,
+             collect(DISTINCT CASE WHEN r IS NULL THEN null ELSE {
                  predicate: type(r),
-                 direction: 'outgoing',
+                 direction: CASE WHEN startNode(r) = e THEN 'outgoing' ELSE 'incoming' END,
                  object: {
                      id: elementId(related),
                      label: COALESCE(related.name, related.label, related.id, related.code, elementId(related)),
                      type: head(labels(related))
                  }
-             }) as outgoing
-        
-        OPTIONAL MATCH (e)<-[r2]-(related2)
-        WITH e, nodeLabels, props, outgoing,
-             collect(DISTINCT {
-                 predicate: type(r2),
-                 direction: 'incoming',
-                 object: {
-                     id: elementId(related2),
-                     label: COALESCE(related2.name, related2.label, related2.id, related2.code, elementId(related2)),
-                     type: head(labels(related2))
-                 }
-             }) as incoming
+             } END) as relations
         
         RETURN {
             id: elementId(e),
             label: COALESCE(e.name, e.label, e.id, e.code, elementId(e)),
             type: head(nodeLabels),
             properties: props,
-            relations: outgoing + incoming
+            relations: relations
         } as entity
         LIMIT 1
         """
         
-        results = await self.client.execute_query(query, {"entity_id": entity_id})
+        results = await self.client.execute_query(query, {"entity_id": entity_id}, coalesce=True)
         
-        if not results or not results[0].get("entity"):
-            return None
+        entity = None
+        if results and results[0].get("entity"):
+            # Serialize all Neo4j types to JSON-compatible Python types
+            entity = _entity_row(results[0]["entity"])
         
-        entity = results[0]["entity"]
+        self._entity_cache.set(entity_id, entity)
+        return entity
+    
+    async def get_by_ids(self, entity_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get several entities by elementId in a single round-trip.
         
-        # Serialize all Neo4j types to JSON-compatible Python types
-        entity = serialize_neo4j_types(entity)
+        Returns id, label, type and properties (no relations) for each ID
+        that exists, in the order given. Unknown IDs are skipped.
+        """
+        if not entity_ids:
+            return []
         
-        # Filter out null relations and clean up
-        if entity.get("relations"):
-            entity["relations"] = [
-                r for r in entity["relations"]
-                if r.get("object") and r["object"].get("id")
-            ]
+        query = """
+        UNWIND $entity_ids AS entity_id
+        MATCH (e)
+        WHERE elementId(e) = entity_id
+        RETURN {
+            id: elementId(e),
+            label: COALESCE(e.name, e.label, e.id, e.code, elementId(e)),
+            type: head(labels(e)),
+            properties: [k IN keys(e) WHERE NOT k IN ['embedding', 'searchText'] | [k, e[k]]]
+        } as entity
+        """
         
-        return entity
+        results = await self.client.execute_query(
+            query,
+            {"entity_ids": list(entity_ids)},
+            coalesce=True
+        )
+        entities = [serialize_neo4j_types(r["entity"]) for r in results]
+        for entity in entities:
+            entity["properties"] = dict(entity["properties"] or ())
+        return entities
     
     async def search(
         self,
@@ -233,6 +714,9 @@ class Neo4jEntityRepository(EntityRepository):
         """Production-grade keyword search with multi-word support.
         
         Industry best practices:
+        0. Fetch candidates from the keyword fulltext index (word prefixes)
+           rather than scanning every entity node; scan when the index
+           fails, finds nothing, or does not cover the type filter
         1. Create searchable text from all properties (searchText)
         2. Use Cypher pattern matching with scoring weights
         3. Handle multi-word queries efficiently in Cypher
@@ -247,230 +731,107 @@ class Neo4jEntityRepository(EntityRepository):
             query: Search query string
             limit: Maximum number of results
             filters: Optional filters (e.g., {"type": "Disease"})
+        
+        Raises:
+            ValueError: If the type filter is not a known entity type
         """
         filters = filters or {}
         query_lower = query.lower().strip()
-        words = [w for w in query_lower.split() if len(w) > 0]
-        
-        # Build WHERE clause based on filters
-        if filters.get("type"):
-            # Filter by specific type
-            type_filter = f"WHERE n:{filters['type']}"
-        else:
-            # Default: search all entity types
-            type_filter = """WHERE n:Country OR n:Disease OR n:Outbreak OR n:Organization 
-           OR n:Vaccine OR n:VaccinationRecord"""
-        
-        # Comprehensive search with efficient multi-word handling
-        cypher = f"""
-        MATCH (n)
-        {type_filter}
-        
-        // Build searchable text from all important properties
-        WITH n,
-             toLower(COALESCE(n.name, '') + ' ' + 
-                     COALESCE(n.fullName, '') + ' ' +
-                     COALESCE(n.id, '') + ' ' +
-                     COALESCE(n.label, '') + ' ' +
-                     COALESCE(n.code, '') + ' ' +
-                     COALESCE(n.description, '') + ' ' +
-                     COALESCE(n.wikipediaAbstract, '') + ' ' +
-                     COALESCE(n.category, '') + ' ' +
-                     COALESCE(n.icd10, '') + ' ' +
-                     COALESCE(n.mesh, '') + ' ' +
-                     COALESCE(n.continent, '') + ' ' +
-                     COALESCE(n.capital, '') + ' ' +
-                     COALESCE(n.acronym, '') + ' ' +
-                     COALESCE(n.vaccineName, '') + ' ' +
-                     COALESCE(n.manufacturer, '') + ' ' +
-                     COALESCE(n.role, '') + ' ' +
-                     COALESCE(toString(n.year), '') + ' ' +
-                     // Arrays as space-separated strings
-                     REDUCE(s = '', x IN COALESCE(n.symptoms, []) | s + ' ' + x) + ' ' +
-                     REDUCE(s = '', x IN COALESCE(n.drugs, []) | s + ' ' + x) + ' ' +
-                     REDUCE(s = '', x IN COALESCE(n.treatments, []) | s + ' ' + x) + ' ' +
-                     REDUCE(s = '', x IN COALESCE(n.possibleTreatments, []) | s + ' ' + x) + ' ' +
-                     REDUCE(s = '', x IN COALESCE(n.transmissionMethods, []) | s + ' ' + x) + ' ' +
-                     REDUCE(s = '', x IN COALESCE(n.riskFactors, []) | s + ' ' + x)
-             ) as searchText
-        
-        // Multi-word scoring: each word must appear, sum up individual scores
-        WITH n, searchText,
-             REDUCE(totalScore = 0.0, word IN $words |
-                 totalScore + CASE
-                     // Exact entity type match
-                     WHEN word IN ['disease', 'diseases'] AND n:Disease THEN 9.0
-                     WHEN word IN ['country', 'countries'] AND n:Country THEN 9.0
-                     WHEN word IN ['outbreak', 'outbreaks'] AND n:Outbreak THEN 9.0
-                     WHEN word IN ['vaccine', 'vaccines'] AND n:Vaccine THEN 9.0
-                     WHEN word IN ['vaccination', 'vaccinations'] AND n:VaccinationRecord THEN 9.0
-                     WHEN word IN ['organization', 'organisations'] AND n:Organization THEN 9.0
-
-                     
-                     // Exact property matches (highest value)
-                     WHEN toLower(COALESCE(n.name, '')) = word THEN 10.0
-                     WHEN toLower(COALESCE(n.id, '')) = word THEN 10.0
-                     WHEN toLower(COALESCE(n.code, '')) = word THEN 10.0
-                     
-                     // Property starts with word (high value)
-                     WHEN toLower(COALESCE(n.name, '')) STARTS WITH word THEN 8.0
-                     WHEN toLower(COALESCE(n.fullName, '')) STARTS WITH word THEN 8.0
-                     WHEN toLower(COALESCE(n.id, '')) STARTS WITH word THEN 7.0
-                     
-                     // Word appears in searchText (main matching)
-                     WHEN searchText CONTAINS word THEN 
-                         CASE
-                             // Boost if in high-priority fields
-                             WHEN toLower(COALESCE(n.name, '')) CONTAINS word THEN 6.0
-                             WHEN toLower(COALESCE(n.fullName, '')) CONTAINS word THEN 6.0
-                             WHEN toLower(COALESCE(n.icd10, '')) CONTAINS word THEN 7.0
-                             WHEN toLower(COALESCE(n.mesh, '')) CONTAINS word THEN 7.0
-                             WHEN toLower(COALESCE(n.vaccineName, '')) CONTAINS word THEN 6.0
-                             WHEN toLower(COALESCE(n.acronym, '')) CONTAINS word THEN 6.0
-                             // Arrays
-                             WHEN ANY(x IN COALESCE(n.symptoms, []) WHERE toLower(x) CONTAINS word) THEN 5.5
-                             WHEN ANY(x IN COALESCE(n.drugs, []) WHERE toLower(x) CONTAINS word) THEN 5.5
-                             WHEN ANY(x IN COALESCE(n.treatments, []) WHERE toLower(x) CONTAINS word) THEN 5.5
-                             WHEN ANY(x IN COALESCE(n.possibleTreatments, []) WHERE toLower(x) CONTAINS word) THEN 5.5
-                             // Descriptions and other fields
-                             WHEN toLower(COALESCE(n.description, '')) CONTAINS word THEN 4.0
-                             WHEN toLower(COALESCE(n.wikipediaAbstract, '')) CONTAINS word THEN 4.0
-                             ELSE 3.0  // Found in searchText but lower priority field
-                         END
-                     ELSE 0.0  // Word not found
-                 END
-             ) as match_score,
-             // Count how many query words matched (including entity type matches)
-             REDUCE(matchCount = 0, word IN $words |
-                 matchCount + CASE 
-                     // Entity type matches
-                     WHEN word IN ['disease', 'diseases'] AND n:Disease THEN 1
-                     WHEN word IN ['country', 'countries'] AND n:Country THEN 1
-                     WHEN word IN ['outbreak', 'outbreaks'] AND n:Outbreak THEN 1
-                     WHEN word IN ['vaccine', 'vaccines'] AND n:Vaccine THEN 1
-                     WHEN word IN ['vaccination', 'vaccinations'] AND n:VaccinationRecord THEN 1
-                     WHEN word IN ['organization', 'organisations'] AND n:Organization THEN 1
-
-                     // Text matches
-                     WHEN searchText CONTAINS word THEN 1 
-                     ELSE 0 
-                 END
-             ) as words_matched
         
-        // Filter: Must match at least one word (OR logic)
-        // Multi-word matches will naturally score higher
-        WHERE match_score > 0
+        # Cached rows are shared between callers; consumers copy before
+        # modifying an entity (see the retrievers)
+        cache_key = (query_lower, limit, repr(sorted(filters.items())))
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
         
-        // Boost multi-word matches where words appear close together
-        WITH n, match_score, words_matched,
-             CASE 
-                 WHEN size($words) > 1 AND searchText CONTAINS $fullQuery 
-                 THEN match_score * 1.5  // Exact phrase bonus
-                 ELSE match_score
-             END as final_score
+        words = query_lower.split()
+        if not words:
+            # Nothing to match (empty/whitespace-only query)
+            logger.debug("Empty keyword search, returning []")
+            return []
         
-        // Create entity representation
-        WITH n, final_score,
-        CASE 
-            WHEN n:Disease THEN COALESCE(n.fullName, n.name, n.id)
-            WHEN n:Country THEN COALESCE(n.name, n.code)
-            WHEN n:Organization THEN COALESCE(n.name, n.acronym)
-            WHEN n:Vaccine THEN COALESCE(n.name, n.vaccineName, n.label)
-            WHEN n:Outbreak THEN COALESCE(n.id, n.label)
-            WHEN n:VaccinationRecord THEN COALESCE(n.name, n.label, n.id, n.code)
-            WHEN n:PandemicEvent THEN COALESCE(n.name, n.label, n.title)
-            ELSE COALESCE(n.name, n.label, n.title, n.id)
-        END as entity_label,
-        CASE 
-            WHEN n:Disease THEN 
-                CASE WHEN size(COALESCE(n.symptoms, [])) > 0 
-                     THEN 'Symptoms: ' + REDUCE(s = '', x IN n.symptoms[..3] | 
-                          s + CASE WHEN s <> '' THEN ', ' ELSE '' END + x)
-                     ELSE COALESCE(substring(n.description, 0, 150), '') END
-            WHEN n:Country THEN 
-                COALESCE(n.continent, '') + 
-                CASE WHEN n.capital IS NOT NULL THEN ' | Capital: ' + n.capital ELSE '' END
-            WHEN n:Organization THEN COALESCE(n.role, '')
-            WHEN n:Vaccine THEN COALESCE('Manufacturer: ' + n.manufacturer, '')
-            WHEN n:Outbreak THEN 
-                CASE WHEN n.cases IS NOT NULL THEN toString(n.cases) + ' cases' ELSE '' END +
-                CASE WHEN n.deaths IS NOT NULL THEN ', ' + toString(n.deaths) + ' deaths' ELSE '' END
-            ELSE COALESCE(substring(n.description, 0, 150), '')
-        END as entity_snippet
-        
-        // Return matched entities
-        RETURN {{
-            id: elementId(n),
-            label: entity_label,
-            type: head(labels(n)),
-            snippet: entity_snippet,
-            match_type: 'direct',
-            properties: properties(n)
-        }} as entity, final_score as score
+        # The type filter becomes a label in the query text, so it is
+        # normalized to a known entity label ("disease" -> Disease)
+        entity_type = filters.get("type")
+        if entity_type:
+            label = _BROWSER_LABELS.get(entity_type.lower())
+            if label is None:
+                raise ValueError(f"Unsupported entity type filter: {entity_type!r}")
+            entity_type = label
+        # Labels outside the keyword index can only be searched by a scan
+        index_searchable = entity_type is None or entity_type in FULLTEXT_LABELS
         
-        ORDER BY score DESC, entity_label ASC
-        LIMIT $limit
-        """
+        lucene_query = _lucene_query(words)
+        type_labels = tuple(sorted({_TYPE_WORDS[w] for w in words if w in _TYPE_WORDS}))
+        params = {
+            "words": words,
+            "wordSpecs": [{"word": w, "label": _TYPE_WORDS.get(w)} for w in words],
+            "fullQuery": query_lower,  # For exact phrase matching
+            "luceneQuery": lucene_query,
+            "candidates": SEARCH_CANDIDATES,
+            "limit": limit
+        }
         
         try:
-            results = await self.client.execute_query(
-                cypher,
-                {
-                    "words": words,
-                    "fullQuery": query_lower,  # For exact phrase matching
-                    "limit": limit
-                }
-            )
+            results = []
+            if lucene_query and index_searchable:
+                try:
+                    results = await self.client.execute_query(
+                        _search_query(True, type_labels, entity_type), params, coalesce=True
+                    )
+                except Exception as e:
+                    # e.g. the index is missing or still populating
+                    logger.warning(f"Keyword index search failed, falling back to a label scan: {e}")
+            if not results:
+                # The index only matches whole terms and prefixes; the scan
+                # also finds infix matches (years, parts of ids, ...)
+                results = await self.client.execute_query(
+                    _search_query(False, (), entity_type), params, coalesce=True
+                )
             
             logger.debug(f"Keyword search for '{query}' ({len(words)} words) returned {len(results)} results")
             
-            # Flatten structure and filter embedding property
-            clean_results = []
-            for r in results:
-                entity = r.get('entity', {})
-                score = r.get('score', 0)
-                
-                # Filter out embedding from properties
-                if entity and entity.get('properties'):
-                    props = entity['properties'].copy()
-                    if 'embedding' in props:
-                        del props['embedding']
-                    entity['properties'] = props
-                
-                # Flatten structure: merge entity fields with score at top level
-                flattened = {
-                    'score': score,
-                    **entity  # Spread entity fields (id, label, type, snippet, properties)
+            # Rows are already flat; add the snippet and rebuild the
+            # properties from their [key, value] pairs
+            clean_results = [
+                {
+                    'score': r['score'],
+                    'id': r['id'],
+                    'label': r['label'],
+                    'type': r['type'],
+                    'snippet': _snippet(r['type'], properties),
+                    'match_type': 'direct',
+                    'properties': properties
                 }
-                clean_results.append(flattened)
+                for r in results
+                for properties in (dict(r['properties'] or ()),)
+            ]
             
             logger.info(f"✓ Returned {len(clean_results)} results after filtering")
-            return clean_results
+            self._search_cache.set(cache_key, clean_results)
+            return list(clean_results)
             
         except Exception as e:
             logger.error(f"Search error: {e}", exc_info=True)
             return []
     
     async def get_related(self, entity_id: str, max_depth: int = 1) -> List[Dict[str, Any]]:
-        """Get related entities via relationships."""
-        # Build query with literal max_depth (Neo4j doesn't allow params in relationship patterns)
-        query = f"""
-        MATCH (e)-[r*1..{max_depth}]-(related)
-        WHERE elementId(e) = $entity_id
-        RETURN DISTINCT {{
-            id: elementId(related),
-            label: COALESCE(related.name, related.label, related.id, related.code, elementId(related)),
-            type: head(labels(related))
-        }} as entity
-        LIMIT 50
-        """
+        """Get related entities via relationships (depth clamped to 1..MAX_RELATED_DEPTH)."""
+        depth = min(max(int(max_depth), 1), MAX_RELATED_DEPTH)
+        cached = self._related_cache.get((entity_id, depth))
+        if cached is not None:
+            return list(cached)
+        
         results = await self.client.execute_query(
-            query,
-            {"entity_id": entity_id}
+            _related_query(depth),
+            {"entity_id": entity_id},
+            coalesce=True
         )
 
-        # Serialize results
-        return [serialize_neo4j_types(r["entity"]) for r in results]
+        related = [_related_row(r["entity"]) for r in results]
+        self._related_cache.set((entity_id, depth), related)
+        return list(related)
 
     async def get_by_type(
         self,
@@ -492,98 +853,46 @@ class Neo4jEntityRepository(EntityRepository):
             filters: Dictionary of property filters (e.g., {"continent": "Asia"})
         """
         filters = filters or {}
+        cache_key = (entity_type.lower(), search.lower(), sort_by, limit,
+                     repr(sorted(filters.items())))
+        cached = self._type_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
         
-        # Map frontend type names to Neo4j labels
-        type_mapping = {
-            "country": "Country",
-            "disease": "Disease",
-            "outbreak": "Outbreak",
-            "vaccinationrecord": "VaccinationRecord",
-            "organization": "Organization",
-            "vaccine": "Vaccine",
-            "pandemicevent": "PandemicEvent"
-        }
-
-        neo4j_label = type_mapping.get(entity_type.lower(), entity_type)
-
-        # Build search condition
-        search_condition = ""
-        if search:
-            search_lower = search.lower()
-            search_condition = """
-            AND (
-                toLower(COALESCE(n.name, '')) CONTAINS $search
-                OR toLower(COALESCE(n.fullName, '')) CONTAINS $search
-                OR toLower(COALESCE(n.label, '')) CONTAINS $search
-                OR toLower(COALESCE(n.id, '')) CONTAINS $search
-                OR toLower(COALESCE(n.code, '')) CONTAINS $search
-                OR toLower(COALESCE(n.description, '')) CONTAINS $search
-            )
-            """
+        # Only known labels: labels cannot be parameters, so this is
+        # spliced into the query text
+        neo4j_label = _BROWSER_LABELS.get(entity_type.lower())
+        if neo4j_label is None:
+            return []
 
-        # Build property filter conditions
-        filter_conditions = []
-        filter_params = {}
+        # Property filters as parameters ({"key", "value"} pairs), so the
+        # keys never reach the query text
+        property_filters = []
         for key, value in filters.items():
             if value:  # Only add non-empty filters
-                param_name = f"filter_{key}"
-                # Handle boolean filters
+                # Handle boolean filters; other strings match exactly
                 if value in ['true', 'false']:
-                    filter_conditions.append(f"n.{key} = ${param_name}")
-                    filter_params[param_name] = (value == 'true')
-                else:
-                    # String filters - exact match
-                    filter_conditions.append(f"n.{key} = ${param_name}")
-                    filter_params[param_name] = value
-        
-        filter_clause = ""
-        if filter_conditions:
-            filter_clause = "AND " + " AND ".join(filter_conditions)
-
-        # Build sort expression
-        if sort_by == "id":
-            sort_expr = "COALESCE(n.id, n.code, elementId(n))"
-        else:  # default to name
-            sort_expr = "COALESCE(n.name, n.fullName, n.label, n.id, n.code, elementId(n))"
-
-        query = f"""
-        MATCH (n:{neo4j_label})
-        WHERE 1=1 {search_condition} {filter_clause}
+                    value = (value == 'true')
+                property_filters.append({"key": key, "value": value})
 
-        WITH n, {sort_expr} as sortValue
-
-        RETURN {{
-            id: elementId(n),
-            label: COALESCE(n.name, n.id, n.code, elementId(n)),
-            type: head(labels(n)),
-            description: COALESCE(n.description, n.wikipediaAbstract, ''),
-            properties: properties(n)
-        }} as entity
-
-        ORDER BY sortValue ASC
-        LIMIT $limit
-        """
-
-        params = {"limit": limit, **filter_params}
+        query = _by_type_query(neo4j_label, bool(search), sort_by == "id")
+        params = {"limit": limit, "filters": property_filters}
         if search:
             params["search"] = search.lower()
 
         try:
-            results = await self.client.execute_query(query, params)
+            results = await self.client.execute_query(query, params, coalesce=True)
 
             # Serialize and clean up results
             clean_results = []
             for r in results:
                 entity = serialize_neo4j_types(r.get('entity', {}))
-
-                # Remove embedding from properties
-                if entity.get('properties') and 'embedding' in entity['properties']:
-                    del entity['properties']['embedding']
-
+                entity['properties'] = dict(entity.get('properties') or ())
                 clean_results.append(entity)
 
             logger.info(f"Retrieved {len(clean_results)} entities of type {entity_type} with filters {filters}")
-            return clean_results
+            self._type_cache.set(cache_key, clean_results)
+            return list(clean_results)
 
         except Exception as e:
             logger.error(f"Error getting entities by type {entity_type}: {e}", exc_info=True)
@@ -603,6 +912,10 @@ class Neo4jEntityRepository(EntityRepository):
         Returns:
             List of countries with code and name
         """
+        cached = self._countries_cache.get((entity_id, data_type))
+        if cached is not None:
+            return list(cached)
+        
         if data_type == "outbreaks":
             # Get countries with outbreak data for this disease
             query = """
@@ -625,7 +938,7 @@ class Neo4jEntityRepository(EntityRepository):
             """
 
         try:
-            results = await self.client.execute_query(query, {"entity_id": entity_id})
+            results = await self.client.execute_query(query, {"entity_id": entity_id}, coalesce=True)
 
             countries = [
                 {"code": r["code"], "name": r["name"]}
@@ -634,7 +947,8 @@ class Neo4jEntityRepository(EntityRepository):
             ]
 
             logger.info(f"Found {len(countries)} countries with {data_type} data for entity {entity_id}")
-            return countries
+            self._countries_cache.set((entity_id, data_type), countries)
+            return list(countries)
 
         except Exception as e:
             logger.error(f"Error getting countries for entity {entity_id}: {e}", exc_info=True)
@@ -662,24 +976,14 @@ class Neo4jEntityRepository(EntityRepository):
         Returns:
             List of time-series data points
         """
-        # Build country filter
-        country_filter = ""
-        if countries and len(countries) > 0 and not (len(countries) == 1 and countries[0] == "ALL"):
-            country_filter = "AND c.code IN $countries"
-
-        # Build year filter for outbreaks
-        outbreak_year_filter = ""
-        if year_start is not None:
-            outbreak_year_filter += f" AND o.year >= {year_start}"
-        if year_end is not None:
-            outbreak_year_filter += f" AND o.year <= {year_end}"
-
-        # Build year filter for vaccinations
-        vaccination_year_filter = ""
-        if year_start is not None:
-            vaccination_year_filter += f" AND v.year >= {year_start}"
-        if year_end is not None:
-            vaccination_year_filter += f" AND v.year <= {year_end}"
+        # Country and year filters are parameters ($countries/$year_start/
+        # $year_end may be null), so there is one query text per data type
+        # and aggregation
+        country_filter = "AND ($countries IS NULL OR c.code IN $countries)"
+        outbreak_year_filter = """AND ($year_start IS NULL OR o.year >= $year_start)
+                  AND ($year_end IS NULL OR o.year <= $year_end)"""
+        vaccination_year_filter = """AND ($year_start IS NULL OR v.year >= $year_start)
+                  AND ($year_end IS NULL OR v.year <= $year_end)"""
 
         if data_type == "outbreaks":
             # Query outbreak data
@@ -735,12 +1039,17 @@ class Neo4jEntityRepository(EntityRepository):
                 ORDER BY year, country
                 """
 
-        params = {"entity_id": entity_id}
+        params = {
+            "entity_id": entity_id,
+            "countries": None,
+            "year_start": year_start,
+            "year_end": year_end
+        }
         if countries and len(countries) > 0 and not (len(countries) == 1 and countries[0] == "ALL"):
             params["countries"] = countries
 
         try:
-            results = await self.client.execute_query(query, params)
+            results = await self.client.execute_query(query, params, coalesce=True)
 
             # Serialize and format results
             data = []
@@ -767,98 +1076,13 @@ class Neo4jEntityRepository(EntityRepository):
         
         Returns country-level outbreak data with geographic coordinates.
         """
+        key = (disease_id, year)
+        cached = self._heatmap_cache.get(key)
+        if cached is not None:
+            # Copies, so a caller mutating the result can't corrupt the cache
+            return {**cached, "countries": list(cached["countries"])}
         try:
-            # First, get disease info
-            disease_query = """
-            MATCH (d:Disease)
-            WHERE elementId(d) = $disease_id
-            RETURN d.name as diseaseName, d.id as diseaseCode
-            """
-            disease_result = await self.client.execute_query(disease_query, {"disease_id": disease_id})
-            
-            if not disease_result:
-                logger.warning(f"Disease not found: {disease_id}")
-                return {
-                    "countries": [],
-                    "availableYears": [],
-                    "selectedYear": None,
-                    "diseaseName": "Unknown"
-                }
-            
-            disease_name = disease_result[0].get("diseaseName", "Unknown")
-            
-            # Get available years
-            years_query = """
-            MATCH (d:Disease)
-            WHERE elementId(d) = $disease_id
-            MATCH (o:Outbreak)-[:CAUSED_BY]->(d)
-            WHERE o.year IS NOT NULL
-            RETURN DISTINCT o.year as year
-            ORDER BY year DESC
-            """
-            years_result = await self.client.execute_query(years_query, {"disease_id": disease_id})
-            available_years = sorted([r["year"] for r in years_result if r.get("year")], reverse=True)
-            
-            # Determine year to use
-            selected_year = year if year else (available_years[0] if available_years else None)
-            
-            if not selected_year:
-                return {
-                    "countries": [],
-                    "availableYears": [],
-                    "selectedYear": None,
-                    "diseaseName": disease_name
-                }
-            
-            # Get country data for the selected year
-            data_query = """
-            MATCH (d:Disease)
-            WHERE elementId(d) = $disease_id
-            MATCH (o:Outbreak)-[:CAUSED_BY]->(d)
-            MATCH (o)-[:OCCURRED_IN]->(c:Country)
-            WHERE o.year = $year
-            WITH c, 
-                 sum(COALESCE(o.cases, o.confirmedDeaths, o.excessDeaths, o.deaths, 0)) as totalCases,
-                 sum(COALESCE(o.deaths, o.confirmedDeaths, o.excessDeaths, 0)) as totalDeaths
-            WHERE totalCases > 0 OR totalDeaths > 0
-            RETURN c.code as countryCode,
-                   c.name as countryName,
-                   totalCases as cases,
-                   totalDeaths as deaths,
-                   c.latitude as latitude,
-                   c.longitude as longitude
-            ORDER BY totalCases DESC
-            """
-            
-            params = {
-                "disease_id": disease_id,
-                "year": selected_year
-            }
-            
-            results = await self.client.execute_query(data_query, params)
-            
-            # Serialize and format
-            countries = []
-            for r in results:
-                country_data = serialize_neo4j_types(r)
-                countries.append({
-                    "countryCode": country_data.get("countryCode"),
-                    "countryName": country_data.get("countryName"),
-                    "cases": int(country_data.get("cases", 0)),
-                    "deaths": int(country_data.get("deaths", 0)) if country_data.get("deaths") else None,
-                    "latitude": float(country_data.get("latitude")) if country_data.get("latitude") else None,
-                    "longitude": float(country_data.get("longitude")) if country_data.get("longitude") else None
-                })
-            
-            logger.info(f"Retrieved heatmap data for {disease_name} in {selected_year}: {len(countries)} countries")
-            
-            return {
-                "countries": countries,
-                "availableYears": available_years,
-                "selectedYear": selected_year,
-                "diseaseName": disease_name
-            }
-            
+            data = await self._load_heatmap_data(disease_id, year)
         except Exception as e:
             logger.error(f"Error getting heatmap data: {e}", exc_info=True)
             return {
@@ -867,6 +1091,104 @@ class Neo4jEntityRepository(EntityRepository):
                 "selectedYear": None,
                 "diseaseName": "Error"
             }
+        self._heatmap_cache.set(key, data)
+        return {**data, "countries": list(data["countries"])}
+
+    async def _load_heatmap_data(
+        self,
+        disease_id: str,
+        year: Optional[int]
+    ) -> Dict[str, Any]:
+        # First, get disease info
+        disease_query = """
+        MATCH (d:Disease)
+        WHERE elementId(d) = $disease_id
+        RETURN d.name as diseaseName, d.id as diseaseCode
+        """
+        disease_result = await self.client.execute_query(disease_query, {"disease_id": disease_id}, coalesce=True)
+        
+        if not disease_result:
+            logger.warning(f"Disease not found: {disease_id}")
+            return {
+                "countries": [],
+                "availableYears": [],
+                "selectedYear": None,
+                "diseaseName": "Unknown"
+            }
+        
+        disease_name = disease_result[0].get("diseaseName", "Unknown")
+        
+        # Get available years
+        years_query = """
+        MATCH (d:Disease)
+        WHERE elementId(d) = $disease_id
+        MATCH (o:Outbreak)-[:CAUSED_BY]->(d)
+        WHERE o.year IS NOT NULL
+        RETURN DISTINCT o.year as year
+        ORDER BY year DESC
+        """
+        years_result = await self.client.execute_query(years_query, {"disease_id": disease_id}, coalesce=True)
+        available_years = sorted([r["year"] for r in years_result if r.get("year")], reverse=True)
+        
+        # Determine year to use
+        selected_year = year if year else (available_years[0] if available_years else None)
+        
+        if not selected_year:
+            return {
+                "countries": [],
+                "availableYears": [],
+                "selectedYear": None,
+                "diseaseName": disease_name
+            }
+        
+        # Get country data for the selected year
+        data_query = """
+        MATCH (d:Disease)
+        WHERE elementId(d) = $disease_id
+        MATCH (o:Outbreak)-[:CAUSED_BY]->(d)
+        MATCH (o)-[:OCCURRED_IN]->(c:Country)
+        WHERE o.year = $year
+        WITH c, 
+             sum(COALESCE(o.cases, o.confirmedDeaths, o.excessDeaths, o.deaths, 0)) as totalCases,
+             sum(COALESCE(o.deaths, o.confirmedDeaths, o.excessDeaths, 0)) as totalDeaths
+        WHERE totalCases > 0 OR totalDeaths > 0
+        RETURN c.code as countryCode,
+               c.name as countryName,
+               totalCases as cases,
+               totalDeaths as deaths,
+               c.latitude as latitude,
+               c.longitude as longitude
+        ORDER BY totalCases DESC
+        """
+        
+        params = {
+            "disease_id": disease_id,
+            "year": selected_year
+        }
+        
+        results = await self.client.execute_query(data_query, params, coalesce=True)
+        
+        # Serialize and format
+        countries = []
+        for r in results:
+            country_data = serialize_neo4j_types(r)
+            countries.append({
+                "countryCode": country_data.get("countryCode"),
+                "countryName": country_data.get("countryName"),
+                "cases": int(country_data.get("cases", 0)),
+                "deaths": int(country_data.get("deaths", 0)) if country_data.get("deaths") else None,
+                "latitude": float(country_data.get("latitude")) if country_data.get("latitude") else None,
+                "longitude": float(country_data.get("longitude")) if country_data.get("longitude") else None
+            })
+        
+        logger.info(f"Retrieved heatmap data for {disease_name} in {selected_year}: {len(countries)} countries")
+        
+        return {
+            "countries": countries,
+            "availableYears": available_years,
+            "selectedYear": selected_year,
+            "diseaseName": disease_name
+        }
 
 
 # SPARQL and Mock classes removed - production uses Neo4j with Cypher only
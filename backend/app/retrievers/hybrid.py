@@ -1,6 +1,6 @@
 """Hybrid retriever combining keyword, semantic, and reranking."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 from .base import BaseRetriever
@@ -63,6 +63,8 @@ class HybridRetriever(BaseRetriever):
         self.use_reranking = use_reranking and reranker is not None
         self.keyword_weight = keyword_weight
         self.semantic_weight = 1.0 - keyword_weight
+        # (keyword, semantic) fusion weights, fixed at construction
+        self._weights = (float(keyword_weight), 1.0 - float(keyword_weight))
         
         # Create sub-retrievers
         self.keyword_retriever = KeywordRetriever(entity_repository)
@@ -128,10 +130,14 @@ class HybridRetriever(BaseRetriever):
             )
             
             # Step 3: Merge using Reciprocal Rank Fusion (RRF)
+            keyword_weight = kwargs.get("keyword_weight")
+            weights = self._weights if keyword_weight is None else (
+                keyword_weight, 1.0 - keyword_weight
+            )
             merged_results = self._merge_results(
                 keyword_results,
                 semantic_results,
-                k=kwargs.get("keyword_weight", self.keyword_weight)
+                weights
             )
             
             # Trim to candidate pool size
@@ -159,7 +165,7 @@ class HybridRetriever(BaseRetriever):
         self,
         keyword_results: List[Dict],
         semantic_results: List[Dict],
-        k: float = 0.5
+        weights: Tuple[float, float] = (0.5, 0.5)
     ) -> List[Dict[str, Any]]:
         """Merge keyword and semantic results using RRF.
         
@@ -172,13 +178,14 @@ class HybridRetriever(BaseRetriever):
         Args:
             keyword_results: Results from keyword search
             semantic_results: Results from semantic search
-            k: Keyword weight (for combining scores, not RRF k)
+            weights: (keyword, semantic) weights for combining scores
         
         Returns:
             Merged and sorted results
         """
         entity_scores = {}
         rrf_k = 60  # Standard RRF constant
+        keyword_weight, semantic_weight = weights
         
         # Process keyword results
         for rank, result in enumerate(keyword_results):
@@ -187,7 +194,7 @@ class HybridRetriever(BaseRetriever):
             
             entity_scores[entity_id] = {
                 "entity": result,
-                "score": rrf_score * k  # Weight by keyword_weight
+                "score": rrf_score * keyword_weight
             }
         
         # Process semantic results
@@ -197,12 +204,12 @@ class HybridRetriever(BaseRetriever):
             
             if entity_id in entity_scores:
                 # Add to existing score
-                entity_scores[entity_id]["score"] += rrf_score * (1.0 - k)
+                entity_scores[entity_id]["score"] += rrf_score * semantic_weight
             else:
                 # New entity
                 entity_scores[entity_id] = {
                     "entity": result,
-                    "score": rrf_score * (1.0 - k)
+                    "score": rrf_score * semantic_weight
                 }
         
         # Sort by combined score
@@ -2,22 +2,17 @@
 
 Endpoints for checking system health, indexes, and configurations.
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 from typing import Dict, Any, List
 
-from ..core.dependencies import container
-from ..db.kg_client import KnowledgeGraphClient
+from ..core.dependencies import KGClientDep, EntityRepositoryDep
+from ..db.kg_client import escape_fulltext_query
 
 router = APIRouter()
 
 
-def get_kg_client() -> KnowledgeGraphClient:
-    """Dependency injection for KG client."""
-    return container.get_kg_client()
-
-
 @router.get("/health")
-async def health_check(client: KnowledgeGraphClient = Depends(get_kg_client)):
+async def health_check(client: KGClientDep):
     """Check if Neo4j connection is healthy."""
     is_healthy = await client.health_check()
     return {
@@ -27,14 +22,14 @@ async def health_check(client: KnowledgeGraphClient = Depends(get_kg_client)):
 
 
 @router.get("/indexes")
-async def list_indexes(client: KnowledgeGraphClient = Depends(get_kg_client)):
+async def list_indexes(client: KGClientDep):
     """List all indexes in Neo4j."""
     if not client.driver:
         return {"error": "Neo4j driver not connected"}
     
-    with client.driver.session(database=client.database) as session:
-        result = session.run("SHOW INDEXES")
-        indexes = result.data()
+    async with client.driver.session(database=client.database) as session:
+        result = await session.run("SHOW INDEXES")
+        indexes = await result.data()
     
     return {
         "total": len(indexes),
@@ -44,24 +39,24 @@ async def list_indexes(client: KnowledgeGraphClient = Depends(get_kg_client)):
 
 @router.get("/indexes/fulltext/test")
 async def test_fulltext_index(
-    query: str = "polio",
-    client: KnowledgeGraphClient = Depends(get_kg_client)
+    client: KGClientDep,
+    query: str = "polio"
 ):
     """Test if fulltext index 'entitySearch' works."""
     if not client.driver:
         return {"error": "Neo4j driver not connected"}
     
     try:
-        with client.driver.session(database=client.database) as session:
-            # Test fulltext index
-            result = session.run("""
-                CALL db.index.fulltext.queryNodes('entitySearch', $query)
+        async with client.driver.session(database=client.database) as session:
+            # Test fulltext index (limit pushed into the index call so
+            # Lucene stops after the top hits)
+            result = await session.run("""
+                CALL db.index.fulltext.queryNodes('entitySearch', $query, {limit: 5})
                 YIELD node, score
                 RETURN node.name as name, labels(node) as labels, score
-                LIMIT 5
-            """, {"query": query})
+            """, {"query": escape_fulltext_query(query)})
             
-            results = result.data()
+            results = await result.data()
             
             return {
                 "status": "working",
@@ -81,25 +76,25 @@ async def test_fulltext_index(
 
 @router.get("/indexes/vector/test")
 async def test_vector_index(
-    client: KnowledgeGraphClient = Depends(get_kg_client)
+    client: KGClientDep
 ):
     """Check if vector index exists and count nodes with embeddings."""
     if not client.driver:
         return {"error": "Neo4j driver not connected"}
     
-    with client.driver.session(database=client.database) as session:
+    async with client.driver.session(database=client.database) as session:
         # Count nodes with embeddings
-        result = session.run("""
+        result = await session.run("""
             MATCH (n)
             WHERE n.embedding IS NOT NULL
             RETURN count(n) as count, labels(n)[0] as type
         """)
         
-        embedding_stats = result.data()
+        embedding_stats = await result.data()
         
         # Check for vector indexes
-        indexes_result = session.run("SHOW INDEXES")
-        all_indexes = indexes_result.data()
+        indexes_result = await session.run("SHOW INDEXES")
+        all_indexes = await indexes_result.data()
         vector_indexes = [
             idx for idx in all_indexes 
             if 'vector' in idx.get('type', '').lower() or 'Embedding' in idx.get('name', '')
@@ -113,7 +108,7 @@ async def test_vector_index(
 
 
 @router.post("/indexes/create")
-async def create_indexes(client: KnowledgeGraphClient = Depends(get_kg_client)):
+async def create_indexes(client: KGClientDep):
     """Manually trigger index creation."""
     if not client.driver:
         return {"error": "Neo4j driver not connected"}
@@ -132,28 +127,27 @@ async def create_indexes(client: KnowledgeGraphClient = Depends(get_kg_client)):
 
 
 @router.get("/stats")
-async def database_stats(client: KnowledgeGraphClient = Depends(get_kg_client)):
+async def database_stats(client: KGClientDep):
     """Get database statistics."""
     if not client.driver:
         return {"error": "Neo4j driver not connected"}
     
-    with client.driver.session(database=client.database) as session:
+    async with client.driver.session(database=client.database) as session:
         # Count nodes by type
-        nodes_result = session.run("""
+        nodes_result = await session.run("""
             MATCH (n)
             RETURN labels(n)[0] as type, count(n) as count
             ORDER BY count DESC
         """)
+        nodes = await nodes_result.data()
         
         # Count relationships
-        rels_result = session.run("""
+        rels_result = await session.run("""
             MATCH ()-[r]->()
             RETURN type(r) as type, count(r) as count
             ORDER BY count DESC
         """)
-        
-        nodes = nodes_result.data()
-        relationships = rels_result.data()
+        relationships = await rels_result.data()
     
     return {
         "nodes": nodes,
@@ -161,3 +155,9 @@ async def database_stats(client: KnowledgeGraphClient = Depends(get_kg_client)):
         "total_nodes": sum(n['count'] for n in nodes),
         "total_relationships": sum(r['count'] for r in relationships)
     }
+
+
+@router.get("/cache-stats")
+async def cache_stats(repo: EntityRepositoryDep):
+    """Hit rates of the repository read caches."""
+    return repo.cache_stats()
@@ -5,25 +5,19 @@ Following best practices:
 - Session management
 - Streaming support (can be added)
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 import uuid
 
 from ..models import ChatRequest, ChatResponse
-from ..services.chatbot_service import ChatbotService
-from ..core.dependencies import container
+from ..core.dependencies import ChatbotServiceDep
 
 router = APIRouter()
 
 
-def get_chatbot_service() -> ChatbotService:
-    """Dependency injection for chatbot service."""
-    return container.get_chatbot_service()
-
-
 @router.post("/", response_model=ChatResponse)
 async def chat(
     req: ChatRequest,
-    service: ChatbotService = Depends(get_chatbot_service)
+    service: ChatbotServiceDep
 ):
     """Chat endpoint with RAG (Retrieval-Augmented Generation).
     
@@ -47,7 +41,7 @@ async def chat(
 @router.delete("/session/{session_id}")
 async def clear_session(
     session_id: str,
-    service: ChatbotService = Depends(get_chatbot_service)
+    service: ChatbotServiceDep
 ):
     """Clear conversation history for a session."""
     service.clear_session(session_id)
@@ -1,25 +1,19 @@
 """Entity router (thin HTTP layer)."""
-from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import List, Dict, Any, Optional
 from ..models import EntityDetail
-from ..services.entity_service import EntityService
-from ..core.dependencies import container
+from ..core.dependencies import EntityServiceDep
 
 router = APIRouter()
 
 
-def get_entity_service() -> EntityService:
-    """Dependency injection for entity service."""
-    return container.get_entity_service()
-
-
 @router.get("/list")
 async def list_entities(
     request: Request,
+    service: EntityServiceDep,
     type: str = Query(..., description="Entity type (country, disease, outbreak, vaccinationrecord, organization)"),
     search: str = Query("", description="Search query for filtering"),
-    sortBy: str = Query("name", description="Sort field (name, id)"),
-    service: EntityService = Depends(get_entity_service)
+    sortBy: str = Query("name", description="Sort field (name, id)")
 ):
     """List entities by type with optional search and filtering.
 
@@ -120,8 +114,8 @@ def generate_filters_for_type(entity_type: str) -> List[Dict[str, Any]]:
 @router.get("/{entity_id}", response_model=EntityDetail)
 async def get_entity(
     entity_id: str,
-    include_related: bool = Query(False, description="Include related entities"),
-    service: EntityService = Depends(get_entity_service)
+    service: EntityServiceDep,
+    include_related: bool = Query(False, description="Include related entities")
 ):
     """Get detailed information about an entity (InfoBox data)."""
     if include_related:
@@ -138,8 +132,8 @@ async def get_entity(
 @router.get("/{entity_id}/countries")
 async def get_entity_countries(
     entity_id: str,
-    dataType: str = Query("outbreaks", description="Type of data: 'outbreaks' or 'vaccinations'"),
-    service: EntityService = Depends(get_entity_service)
+    service: EntityServiceDep,
+    dataType: str = Query("outbreaks", description="Type of data: 'outbreaks' or 'vaccinations'")
 ):
     """Get list of countries that have data for a specific entity (disease).
     
@@ -159,12 +153,12 @@ async def get_entity_countries(
 @router.get("/{entity_id}/timeseries")
 async def get_entity_timeseries(
     entity_id: str,
+    service: EntityServiceDep,
     dataType: str = Query("outbreaks", description="Type of data: 'outbreaks' or 'vaccinations'"),
     countries: Optional[str] = Query(None, description="Comma-separated country codes (or 'ALL')"),
     yearStart: Optional[int] = Query(None, description="Start year for filtering"),
     yearEnd: Optional[int] = Query(None, description="End year for filtering"),
-    aggregation: str = Query("country", description="Aggregation type: 'country' or 'total'"),
-    service: EntityService = Depends(get_entity_service)
+    aggregation: str = Query("country", description="Aggregation type: 'country' or 'total'")
 ):
     """Get time-series data for outbreaks or vaccinations.
     
@@ -3,10 +3,9 @@ Heatmap Router
 
 Provides endpoints for world heatmap visualization data
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Query
 from typing import Optional, List, Dict, Any
-from app.core.dependencies import get_entity_service
-from app.services.entity_service import EntityService
+from app.core.dependencies import EntityServiceDep
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,9 +15,9 @@ router = APIRouter(prefix="/api/heatmap", tags=["heatmap"])
 
 @router.get("")
 async def get_heatmap_data(
+    entity_service: EntityServiceDep,
     diseaseId: str = Query(..., description="Disease element ID"),
-    year: Optional[int] = Query(None, description="Year to filter by"),
-    entity_service: EntityService = Depends(get_entity_service)
+    year: Optional[int] = Query(None, description="Year to filter by")
 ) -> Dict[str, Any]:
     """
     Get country-level outbreak data for heatmap visualization.
@@ -3,28 +3,22 @@
 Allows users to execute custom queries against Neo4j KG.
 Security: Add query validation and rate limiting in production.
 """
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any, List
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 import logging
 
 from ..models import QueryRequest, QueryResponse
-from ..services.query_service import QueryService
-from ..core.dependencies import container
+from ..core.dependencies import QueryServiceDep
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_query_service() -> QueryService:
-    """Dependency injection for query service."""
-    return container.get_query_service()
-
-
 @router.post("/", response_model=QueryResponse)
 async def execute_query(
     request: QueryRequest,
-    service: QueryService = Depends(get_query_service)
-) -> QueryResponse:
+    service: QueryServiceDep
+) -> ORJSONResponse:
     """
     Execute a Cypher query against the knowledge graph.
     
@@ -45,11 +39,14 @@ async def execute_query(
         # Execute query via service
         result = await service.execute_cypher(request.query)
         
-        return QueryResponse(
-            columns=result["columns"],
-            rows=result["rows"],
-            count=len(result["rows"])
-        )
+        # Values are already JSON-native (QueryService._serialize_value);
+        # skip re-validating every row and hand the dict to orjson
+        # (response_model is kept for the OpenAPI schema)
+        return ORJSONResponse({
+            "columns": result["columns"],
+            "rows": result["rows"],
+            "count": len(result["rows"])
+        })
         
     except ValueError as e:
         # Query validation errors
@@ -65,12 +62,13 @@ async def execute_query(
         )
 
 
-@router.get("/examples")
-async def get_query_examples() -> List[Dict[str, Any]]:
+@router.get("/examples", response_class=Response)
+async def get_query_examples() -> Response:
     """
     Get example Cypher queries for user reference.
     
-    Returns curated queries based on actual KG schema.
+    Returns curated queries based on actual KG schema
+    (serialized once at import).
     """
-    from ..query_examples import CYPHER_EXAMPLES
-    return CYPHER_EXAMPLES
+    from ..query_examples import get_examples_json
+    return Response(get_examples_json(), media_type="application/json")
@@ -14,28 +14,16 @@ Old Pipeline (removed):
 2. RerankerService: reranking
 3. SummaryService: summary
 """
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Response
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
 
 from ..models import EntitySummary
-from ..retrievers import BaseRetriever
-from ..services.summary_service import SummaryService
-from ..core.dependencies import container
+from ..core.dependencies import RetrieverDep, SummaryServiceDep
 
 router = APIRouter()
 
 
-def get_retriever() -> BaseRetriever:
-    """Dependency injection for retriever."""
-    return container.get_retriever()
-
-
-def get_summary_service() -> Optional[SummaryService]:
-    """Dependency injection for summary service."""
-    return container.get_summary_service()
-
-
 class SearchResponse(BaseModel):
     """Search response with optional summary."""
     results: List[EntitySummary]
@@ -56,13 +44,13 @@ class PaginatedSearchResponse(BaseModel):
 
 @router.get("/", response_model=PaginatedSearchResponse)
 async def search(
+    retriever: RetrieverDep,
+    summary_service: SummaryServiceDep,
     q: str = Query(..., min_length=1, description="Search query"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(10, ge=1, le=100, description="Results per page"),
     rerank: bool = Query(True, description="Enable cross-encoder reranking"),
-    summarize: bool = Query(True, description="Generate summary of top result"),
-    retriever: BaseRetriever = Depends(get_retriever),
-    summary_service: Optional[SummaryService] = Depends(get_summary_service)
+    summarize: bool = Query(True, description="Generate summary of top result")
 ):
     """Search entities with AI-powered enhancements.
     
@@ -117,8 +105,10 @@ async def search(
     has_next = page < total_pages
     has_prev = page > 1
     
-    return PaginatedSearchResponse(
-        results=[EntitySummary(**r) for r in page_results],
+    # Rows come straight from the repository, so skip re-validation and
+    # serialize once (response_model is kept for the OpenAPI schema)
+    response = PaginatedSearchResponse.model_construct(
+        results=[EntitySummary.model_construct(**r) for r in page_results],
         total=total,
         page=page,
         page_size=page_size,
@@ -127,13 +117,14 @@ async def search(
         has_prev=has_prev,
         summary=summary_data
     )
+    return Response(response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/suggestions")
 async def get_suggestions(
+    retriever: RetrieverDep,
     q: str = Query(..., min_length=1),
-    limit: int = Query(5, ge=1, le=20),
-    retriever: BaseRetriever = Depends(get_retriever)
+    limit: int = Query(5, ge=1, le=20)
 ):
     """Get search suggestions for autocomplete.
     
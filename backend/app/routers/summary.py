@@ -2,13 +2,12 @@
 
 Provides AI-powered summaries for search results and entity groups.
 """
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
 import logging
 
-from ..core.dependencies import container, get_summary_service
-from ..services.summary_service import SummaryService
+from ..core.dependencies import SummaryServiceDep
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +33,7 @@ class SummaryResponse(BaseModel):
 @router.post("/generate", response_model=SummaryResponse)
 async def generate_summary(
     request: SummaryRequest,
-    summary_service: SummaryService = Depends(get_summary_service)
+    summary_service: SummaryServiceDep
 ) -> SummaryResponse:
     """Generate AI summary for a group of entities.
     
@@ -8,11 +8,12 @@ Architecture:
 
 This implements Retrieval-Augmented Generation (RAG) pattern.
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TYPE_CHECKING
 import logging
 
-from ..retrievers import HybridRetriever, BaseRetriever
-from ..utils.llm_groq import GroqLLM
+if TYPE_CHECKING:
+    from ..retrievers import HybridRetriever
+    from ..utils.llm_groq import GroqLLM
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +23,8 @@ class ChatbotService:
     
     def __init__(
         self,
-        retriever: HybridRetriever,
-        llm: GroqLLM,
+        retriever: "HybridRetriever",
+        llm: "GroqLLM",
         max_context_entities: int = 5
     ):
         """Initialize chatbot service.
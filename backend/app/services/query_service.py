@@ -69,15 +69,11 @@ class QueryService:
             # Extract column names from first record
             columns = list(records[0].keys())
             
-            # Convert records to rows
-            rows = []
-            for record in records:
-                row = []
-                for col in columns:
-                    value = record.get(col)
-                    # Convert Neo4j types to JSON-serializable
-                    row.append(self._serialize_value(value))
-                rows.append(row)
+            # Convert records to rows. Every record dict carries the result
+            # keys in the same order, so take values positionally instead of
+            # a key lookup per cell; convert Neo4j types to JSON-serializable
+            serialize = self._serialize_value
+            rows = [[serialize(value) for value in record.values()] for record in records]
             
             return {
                 "columns": columns,
@@ -131,14 +127,20 @@ class QueryService:
         if isinstance(value, dict):
             return {k: self._serialize_value(v) for k, v in value.items()}
         
-        # Neo4j Node
+        # Neo4j Path
+        if hasattr(value, 'nodes') and hasattr(value, 'relationships'):
+            return {
+                "nodes": [self._serialize_value(n) for n in value.nodes],
+                "relationships": [self._serialize_value(r) for r in value.relationships]
+            }
+        
+        # Neo4j Node (properties may hold temporal/spatial values)
         if hasattr(value, 'labels') and hasattr(value, 'items'):
-            # Convert node to dict
-            return dict(value.items())
+            return {k: self._serialize_value(v) for k, v in value.items()}
         
         # Neo4j Relationship
         if hasattr(value, 'type') and hasattr(value, 'items'):
-            return dict(value.items())
+            return {k: self._serialize_value(v) for k, v in value.items()}
         
         # Neo4j DateTime/Date/Time
         if hasattr(value, 'iso_format'):
@@ -3,11 +3,14 @@
 Provides Google-like summaries for search results and entity pages.
 Uses Groq LLM to generate concise, informative summaries from KG facts.
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TYPE_CHECKING
 from ..repositories.entity_repository import EntityRepository
-from ..utils.llm_groq import GroqLLM
+import asyncio
 import logging
 
+if TYPE_CHECKING:
+    from ..utils.llm_groq import GroqLLM
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +20,7 @@ class SummaryService:
     def __init__(
         self,
         entity_repository: EntityRepository,
-        groq_llm: Optional[GroqLLM] = None
+        groq_llm: Optional["GroqLLM"] = None
     ):
         """Initialize summary service.
         
@@ -94,21 +97,34 @@ class SummaryService:
         Returns:
             {"entity_id": str, "summary": str, "context_used": {...}}
         """
+        # Fetch related entities concurrently with the entity itself, so the
+        # two KG round-trips overlap instead of running back to back
+        related_task = (
+            asyncio.ensure_future(self.entity_repo.get_related(entity_id, max_depth=1))
+            if include_relations else None
+        )
+        
         # Fetch entity from KG
-        entity = await self.entity_repo.get_by_id(entity_id)
+        try:
+            entity = await self.entity_repo.get_by_id(entity_id)
+        except BaseException:
+            if related_task:
+                related_task.cancel()
+            raise
         
         if not entity:
+            if related_task:
+                related_task.cancel()
             return {
                 "entity_id": entity_id,
                 "summary": "Entity not found in the knowledge graph.",
                 "context_used": {"properties": 0, "relations": 0}
             }
         
-        # Fetch related entities
         relations = []
-        if include_relations:
+        if related_task:
             try:
-                relations = await self.entity_repo.get_related(entity_id, max_depth=1)
+                relations = await related_task
             except Exception as e:
                 logger.warning(f"Failed to fetch related entities: {e}")
         
@@ -191,11 +207,8 @@ Write a concise 2-3 sentence summary about this entity:"""
         
         # Multiple entities
         if entity_ids and len(entity_ids) > 0:
-            entities_data = []
-            for eid in entity_ids[:10]:  # Limit to 10
-                entity = await self.entity_repo.get_by_id(eid)
-                if entity:
-                    entities_data.append(entity)
+            # One round-trip for all of them
+            entities_data = await self.entity_repo.get_by_ids(entity_ids[:10])  # Limit to 10
             
             if not entities_data:
                 return {
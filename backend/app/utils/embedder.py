@@ -4,7 +4,7 @@ Pure utility for generating text embeddings.
 No business logic, just API calls to Kaggle GPU endpoint.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 import httpx
 import logging
 
@@ -30,6 +30,10 @@ class BaseEmbedder(ABC):
         """Embed batch of texts."""
         pass
     
+    async def warmup(self) -> None:
+        """Open a connection to the backing service ahead of the first request."""
+        pass
+    
     @abstractmethod
     async def close(self):
         """Cleanup resources."""
@@ -47,7 +51,8 @@ class KaggleEmbedder(BaseEmbedder):
         self,
         endpoint_url: str,
         dimension: int = 1536,
-        timeout: int = 30
+        timeout: int = 30,
+        client: Optional[httpx.AsyncClient] = None
     ):
         """Initialize Kaggle embedder.
         
@@ -55,11 +60,14 @@ class KaggleEmbedder(BaseEmbedder):
             endpoint_url: Kaggle endpoint base URL
             dimension: Embedding dimension (1536 for gte-Qwen2)
             timeout: Request timeout in seconds
+            client: Shared HTTP client (owned by the caller); a private
+                client is created when omitted
         """
         self.endpoint_url = endpoint_url.rstrip('/')
         self._dimension = dimension
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=timeout)
         
         logger.info(f"✅ Initialized Kaggle Embedder (dim={dimension})")
     
@@ -73,6 +81,7 @@ class KaggleEmbedder(BaseEmbedder):
         try:
             response = await self.client.post(
                 f"{self.endpoint_url}/embed",
+                timeout=self.timeout,
                 json={
                     "texts": [text],  # ✅ Fixed: Kaggle expects list of texts
                     "normalize": True
@@ -103,6 +112,7 @@ class KaggleEmbedder(BaseEmbedder):
         try:
             response = await self.client.post(
                 f"{self.endpoint_url}/embed",
+                timeout=self.timeout,
                 json={
                     "texts": texts,  # ✅ Already correct format
                     "normalize": True
@@ -122,6 +132,17 @@ class KaggleEmbedder(BaseEmbedder):
             logger.error(f"Kaggle batch embedding error: {e}")
             raise
     
+    async def warmup(self) -> None:
+        """Ping the Kaggle /health endpoint to open a pooled connection."""
+        try:
+            response = await self.client.get(
+                f"{self.endpoint_url}/health", timeout=self.timeout
+            )
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Kaggle embedder warmup failed: {e}")
+    
     async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Close HTTP client (unless it is shared)."""
+        if self._owns_client:
+            await self.client.aclose()
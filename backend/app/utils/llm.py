@@ -4,7 +4,7 @@ Pure utility for LLM text generation and summarization.
 No business logic, just API calls to Kaggle GPU endpoint.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Optional, Dict
 import httpx
 import logging
 
@@ -36,6 +36,10 @@ class BaseLLM(ABC):
         """Generate answer with context (RAG)."""
         pass
     
+    async def warmup(self) -> None:
+        """Open a connection to the backing service ahead of the first request."""
+        pass
+    
     @abstractmethod
     async def close(self):
         """Cleanup resources."""
@@ -55,17 +59,21 @@ class KaggleLLM(BaseLLM):
     def __init__(
         self,
         endpoint_url: str,
-        timeout: int = 60
+        timeout: int = 60,
+        client: Optional[httpx.AsyncClient] = None
     ):
         """Initialize Kaggle LLM.
         
         Args:
             endpoint_url: Kaggle endpoint base URL
             timeout: Request timeout in seconds
+            client: Shared HTTP client (owned by the caller); a private
+                client is created when omitted
         """
         self.endpoint_url = endpoint_url.rstrip('/')
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=timeout)
         
         logger.info(f"✅ Initialized Kaggle LLM")
     
@@ -80,6 +88,7 @@ class KaggleLLM(BaseLLM):
         try:
             response = await self.client.post(
                 f"{self.endpoint_url}/chat",
+                timeout=self.timeout,
                 json={
                     "messages": [{"role": "user", "content": prompt}],
                     "max_tokens": max_tokens,
@@ -105,6 +114,7 @@ class KaggleLLM(BaseLLM):
         try:
             response = await self.client.post(
                 f"{self.endpoint_url}/summarize",
+                timeout=self.timeout,
                 json={
                     "text": text,
                     "max_length": max_length,
@@ -141,6 +151,17 @@ Answer:"""
         
         return await self.generate(prompt, max_tokens=max_tokens, **kwargs)
     
+    async def warmup(self) -> None:
+        """Ping the Kaggle /health endpoint to open a pooled connection."""
+        try:
+            response = await self.client.get(
+                f"{self.endpoint_url}/health", timeout=self.timeout
+            )
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Kaggle LLM warmup failed: {e}")
+    
     async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Close HTTP client (unless it is shared)."""
+        if self._owns_client:
+            await self.client.aclose()
@@ -4,7 +4,7 @@ Pure utility for reranking documents by relevance.
 No business logic, just API calls to Kaggle GPU endpoint.
 """
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import httpx
 import logging
 
@@ -33,6 +33,10 @@ class BaseReranker(ABC):
         """
         pass
     
+    async def warmup(self) -> None:
+        """Open a connection to the backing service ahead of the first request."""
+        pass
+    
     @abstractmethod
     async def close(self):
         """Cleanup resources."""
@@ -49,17 +53,21 @@ class KaggleReranker(BaseReranker):
     def __init__(
         self,
         endpoint_url: str,
-        timeout: int = 30
+        timeout: int = 30,
+        client: Optional[httpx.AsyncClient] = None
     ):
         """Initialize Kaggle reranker.
         
         Args:
             endpoint_url: Kaggle endpoint base URL
             timeout: Request timeout in seconds
+            client: Shared HTTP client (owned by the caller); a private
+                client is created when omitted
         """
         self.endpoint_url = endpoint_url.rstrip('/')
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=timeout)
         
         logger.info(f"✅ Initialized Kaggle Reranker")
     
@@ -75,6 +83,7 @@ class KaggleReranker(BaseReranker):
             
             response = await self.client.post(
                 f"{self.endpoint_url}/rerank",
+                timeout=self.timeout,
                 json={
                     "query": query,
                     "documents": documents,
@@ -96,6 +105,17 @@ class KaggleReranker(BaseReranker):
             logger.error(f"Kaggle reranking error: {e}")
             raise
     
+    async def warmup(self) -> None:
+        """Ping the Kaggle /health endpoint to open a pooled connection."""
+        try:
+            response = await self.client.get(
+                f"{self.endpoint_url}/health", timeout=self.timeout
+            )
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Kaggle reranker warmup failed: {e}")
+    
     async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Close HTTP client (unless it is shared)."""
+        if self._owns_client:
+            await self.client.aclose()
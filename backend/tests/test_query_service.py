@@ -0,0 +1,46 @@
+"""Tests for QueryService result serialization."""
+import asyncio
+
+import orjson
+import pytest
+
+neo4j_time = pytest.importorskip("neo4j.time")
+
+from app.services.query_service import QueryService
+
+
+class _FakeNode:
+    """Stands in for neo4j.graph.Node: labels plus node properties."""
+
+    def __init__(self, labels, properties):
+        self.labels = frozenset(labels)
+        self._properties = properties
+
+    def items(self):
+        return self._properties.items()
+
+
+class _FakeClient:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute_query(self, query, params=None, coalesce=False):
+        return self.rows
+
+
+class _FakeRepository:
+    def __init__(self, client):
+        self.client = client
+
+
+def test_execute_cypher_serializes_node_datetime_properties():
+    enriched_at = neo4j_time.DateTime(2024, 5, 1, 12, 30, 0)
+    node = _FakeNode(["Country"], {"name": "France", "enrichedAt": enriched_at})
+    service = QueryService(_FakeRepository(_FakeClient([{"c": node}])))
+
+    result = asyncio.run(service.execute_cypher("MATCH (c:Country) RETURN c"))
+
+    assert result["columns"] == ["c"]
+    assert result["rows"] == [[{"name": "France", "enrichedAt": enriched_at.iso_format()}]]
+    # The router encodes this with ORJSONResponse
+    orjson.dumps(result)
@@ -444,4 +444,7 @@ if __name__ == "__main__":
     enricher = DBpediaEnricher(conn)
     enricher.enrich_all()
 
+    # Keyword search text for the backend
+    conn.build_search_text()
+
     conn.close()
@@ -74,6 +74,9 @@ def main():
             logger.info("ℹ️  DBpedia endpoint may be down. Continuing without DBpedia enrichment.")
             logger.info("ℹ️  Wikidata enrichment alone is sufficient for project requirements.")
 
+        # Enrichment adds searchable properties (symptoms, abstracts, ...)
+        conn.build_search_text()
+
         # Show database stats after enrichment
         logger.info("\n" + "=" * 60)
         logger.info("=== Database Statistics (After Enrichment) ===")
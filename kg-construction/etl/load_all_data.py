@@ -99,6 +99,9 @@ def main(clear_db=False):
         loader4 = CholeraDataLoader(conn)
         loader4.load(datasets['cholera_deaths'])
 
+        # Keyword search text for the backend (refreshed again by enrich_all.py)
+        conn.build_search_text()
+
         # Show final statistics
         logger.info("\n" + "=" * 60)
         logger.info("RAW DATA LOADING COMPLETE - Database Statistics")
@@ -199,6 +199,9 @@ if __name__ == "__main__":
     loader = DiseaseCasesLoader(conn)
     loader.load(csv_path)
 
+    # Keyword search text for the backend
+    conn.build_search_text()
+
     logger.info("\n" + "=" * 60)
     logger.info("Data loading complete!")
     logger.info("To enrich with external data, run: python enrich_all.py")
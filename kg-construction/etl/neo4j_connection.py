@@ -2,6 +2,8 @@
 Neo4j connection utilities for EpiHelix Knowledge Graph
 """
 import os
+import importlib.util
+from pathlib import Path
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 import logging
@@ -13,6 +15,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared with the backend search, which falls back to evaluating it
+SEARCH_TEXT_MODULE = Path(__file__).resolve().parents[2] / 'backend' / 'app' / 'db' / 'search_text.py'
+
+
+def _search_text_expression():
+    """Load the Cypher searchText expression from the backend source tree"""
+    spec = importlib.util.spec_from_file_location('epihelix_search_text', SEARCH_TEXT_MODULE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.SEARCH_TEXT_EXPRESSION
+
 
 class Neo4jConnection:
     """Handle Neo4j database connections"""
@@ -130,6 +143,27 @@ class Neo4jConnection:
             except Exception as e:
                 logger.warning(f"Index may already exist: {e}")
 
+    def build_search_text(self, batch_size=1000):
+        """Precompute n.searchText for the backend keyword search.
+
+        The expression is defined once in the backend (app/db/search_text.py).
+        Nodes are updated in batches of batch_size, each in its own
+        transaction; run again after loading or enriching data.
+        """
+        logger.info("Building search text...")
+        # CALL { ... } IN TRANSACTIONS needs an auto-commit transaction,
+        # which execute_query (session.run) uses
+        self.execute_query(f"""
+            MATCH (n)
+            WHERE n:Country OR n:Disease OR n:Outbreak OR n:Organization
+               OR n:Vaccine OR n:VaccinationRecord
+            CALL {{
+                WITH n
+                SET n.searchText = {_search_text_expression()}
+            }} IN TRANSACTIONS OF {int(batch_size)} ROWS
+        """)
+        logger.info("✓ searchText")
+
     def clear_database(self):
         """Clear all nodes and relationships (use with caution!)"""
         logger.warning("⚠️  Clearing database...")
@@ -671,6 +671,9 @@ if __name__ == "__main__":
     enricher = WikidataEnricher(conn)
     enricher.enrich_all()
 
+    # Keyword search text for the backend
+    conn.build_search_text()
+
     # Show updated stats
     stats = conn.get_stats()
     print("\n=== Updated Database Statistics ===")